@@ -5,11 +5,12 @@ Modules:
 - behavior.py: Behavioral classification without API features (NEW!)
 - mood.py: Energy/valence trends (requires Spotify features)
 - habits.py: Time patterns, top artists, streaks, session analytics
+- common.py: TrackTable, sorted columnar track storage shared by analyzers
 
 Usage:
     from analysis import BehaviorClassifier, HabitsAnalyzer, load_tracks_from_json
     
-    tracks = load_tracks_from_json("enriched_history.json")
+    tracks = load_tracks_from_json("enriched_history.jsonl")
     behavior = BehaviorClassifier(tracks)  # Works without Spotify features!
     habits = HabitsAnalyzer(tracks)
     
@@ -18,12 +19,14 @@ Usage:
     events = behavior.detect_behavioral_events()
 """
 
-from .mood import MoodAnalyzer, load_tracks_from_json
+from .common import TrackTable
+from .mood import MoodAnalyzer, load_tracks_from_json, resolve_history_path
 from .habits import HabitsAnalyzer
 from .behavior_signals import (
     BehaviorClassifier,
     BehaviorState,
     BehaviorBaseline,
+    SessionStats,
     BehaviorSignal,
     ListeningSession,
     LateNightSignal,
@@ -38,6 +41,7 @@ __all__ = [
     'BehaviorClassifier',
     'BehaviorState',
     'BehaviorBaseline',
+    'SessionStats',
     'BehaviorSignal',
     'ListeningSession',
     'LateNightSignal',
@@ -48,5 +52,7 @@ __all__ = [
     # Other analysis
     'MoodAnalyzer',
     'HabitsAnalyzer',
-    'load_tracks_from_json'
+    'TrackTable',
+    'load_tracks_from_json',
+    'resolve_history_path'
 ]
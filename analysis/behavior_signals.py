@@ -5,6 +5,7 @@ Architecture:
 - BehaviorSignal: Abstract base class for behavioral indicators
 - Concrete signals: LateNightSignal, ReplaySignal, SessionLengthSignal
 - BehaviorBaseline: Historical statistics for deviation detection
+- SessionStats: Vectorized per-session statistics over track columns
 - BehaviorClassifier: Weighted scoring system that aggregates signals
 - BehaviorState: Result with state, confidence, evidence, and intensity
 
@@ -17,12 +18,21 @@ Benefits:
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from datetime import datetime, timedelta
+from typing import Callable, Iterator, List, Dict, Tuple, Optional, Union
 from enum import Enum
-from collections import Counter
+from collections import Counter, defaultdict
+
+import numpy as np
 
 from core.models import Track
+from analysis.common import (
+    TrackTable,
+    _MICROS_PER_DAY,
+    _hour_column,
+    _timestamp_micros,
+    _to_micros,
+)
 
 
 # ============================================================================
@@ -61,6 +71,93 @@ class BehaviorState:
         return f"BehaviorState(state='{self.state}', confidence={self.confidence:.2f}, intensity={self.intensity:.2f}{secondary_str})"
 
 
+@dataclass
+class SessionStats:
+    """
+    Per-session statistics as parallel NumPy arrays (one entry per session).
+    
+    Computed in a single vectorized pass over the track columns, so no
+    per-session Python objects are needed to summarize a long history.
+    """
+    
+    starts: np.ndarray
+    """Index of each session's first track"""
+    
+    ends: np.ndarray
+    """Index one past each session's last track"""
+    
+    duration_minutes: np.ndarray
+    """Span from first to last track, in minutes"""
+    
+    avg_hour: np.ndarray
+    """Mean hour of day (0-24) of the session's tracks"""
+    
+    replay_rate: np.ndarray
+    """Fraction of the session's tracks that were played more than once"""
+    
+    context_switches: np.ndarray
+    """Number of distinct contexts (playlists/albums) in the session"""
+    
+    total_tracks: np.ndarray
+    """Number of tracks in the session"""
+    
+    heavy_replays: np.ndarray
+    """Number of the session's tracks played more than three times in history"""
+    
+    @classmethod
+    def compute(
+        cls,
+        ts: np.ndarray,
+        hours: np.ndarray,
+        replay_masks: np.ndarray,
+        ctx_codes: np.ndarray,
+        bounds: np.ndarray
+    ) -> "SessionStats":
+        """
+        Reduce sorted track columns into per-session statistics.
+        
+        Args:
+            ts: int64 wall-clock microseconds, sorted
+            hours: Hour of day per track
+            replay_masks: (n_tracks, 2) bool array; column 0 marks tracks
+                played more than once in history, column 1 more than three times
+            ctx_codes: Integer context code per track (-1 = no context)
+            bounds: Session boundary indices; session i spans
+                bounds[i]:bounds[i + 1]
+            
+        Returns:
+            SessionStats with one entry per session
+        """
+        bounds = np.asarray(bounds, dtype=np.int64)
+        starts = bounds[:-1]
+        ends = bounds[1:]
+        lengths = ends - starts
+        
+        if not lengths.size:
+            empty = np.zeros(0)
+            return cls(starts, ends, empty, empty, empty, lengths, lengths, lengths)
+        
+        durations = (ts[ends - 1] - ts[starts]) / 1_000_000 / 60
+        avg_hour = np.add.reduceat(hours.astype(np.int64), starts) / lengths
+        
+        # Both replay masks are counted per session in one reduction
+        replay_counts = np.add.reduceat(replay_masks.astype(np.int64), starts, axis=0)
+        replay_rate = replay_counts[:, 0] / lengths
+        
+        # Distinct contexts per session: unique (session, context) pairs,
+        # counted back per session
+        session_ids = np.repeat(np.arange(lengths.size), lengths)
+        has_context = ctx_codes >= 0
+        n_codes = int(ctx_codes.max()) + 1 if ctx_codes.size else 1
+        pairs = np.unique(session_ids[has_context] * n_codes + ctx_codes[has_context])
+        context_switches = np.bincount(pairs // n_codes, minlength=lengths.size)
+        
+        return cls(
+            starts, ends, durations, avg_hour, replay_rate,
+            context_switches, lengths, replay_counts[:, 1]
+        )
+
+
 @dataclass
 class BehaviorBaseline:
     """
@@ -107,11 +204,14 @@ class BehaviorBaseline:
             )
         
         # Convert to ListeningSession objects for property access
+        # (one shared frequency table instead of a Counter per session)
+        track_counts = Counter(t.track_id for t in all_tracks)
         listening_sessions = [
             ListeningSession(
                 session_id=f"baseline_session_{i}",
                 tracks=session_tracks,
-                all_tracks_history=all_tracks
+                all_tracks_history=all_tracks,
+                track_counts=track_counts
             )
             for i, session_tracks in enumerate(sessions)
         ]
@@ -143,6 +243,31 @@ class BehaviorBaseline:
             avg_context_switches=avg_context_switches,
             typical_session_tracks=typical_session_tracks
         )
+    
+    @classmethod
+    def from_session_stats(cls, stats: SessionStats) -> "BehaviorBaseline":
+        """
+        Compute baseline from precomputed per-session statistics.
+        
+        Equivalent to compute(), but each average is a single NumPy
+        reduction instead of a Python pass over ListeningSession objects.
+        
+        Args:
+            stats: SessionStats for the historical sessions
+            
+        Returns:
+            BehaviorBaseline with computed statistics
+        """
+        if not stats.total_tracks.size:
+            return cls.compute([], [])
+        
+        return cls(
+            avg_session_length_minutes=float(stats.duration_minutes.mean()),
+            avg_replay_rate=float(stats.replay_rate.mean()),
+            avg_listening_hour=float(stats.avg_hour.mean()),
+            avg_context_switches=float(stats.context_switches.mean()),
+            typical_session_tracks=float(stats.total_tracks.mean())
+        )
 
 
 # ============================================================================
@@ -521,14 +646,26 @@ class ListeningSession:
     Represents a continuous listening session.
     
     Stores actual Track objects and computes derived properties
-    for efficient behavioral analysis.
+    once at construction, so every signal reads cached values.
     """
     
+    __slots__ = (
+        "session_id",
+        "tracks",
+        "all_tracks_history",
+        "_track_id_counts",
+        "_duration_minutes",
+        "_avg_hour",
+        "_replay_rate",
+        "_context_switches",
+    )
+    
     def __init__(
         self,
         session_id: str,
         tracks: List[Track],
-        all_tracks_history: Optional[List[Track]] = None
+        all_tracks_history: Optional[List[Track]] = None,
+        track_counts: Optional[Dict[str, int]] = None
     ):
         """
         Initialize a listening session.
@@ -537,18 +674,123 @@ class ListeningSession:
             session_id: Unique session identifier
             tracks: List of Track objects in this session (chronological order)
             all_tracks_history: Optional full track history for frequency analysis
+            track_counts: Optional precomputed play counts per track_id across
+                the history (skips recounting all_tracks_history per session)
         """
         self.session_id = session_id
         self.tracks = sorted(tracks, key=lambda t: t.timestamp)
         self.all_tracks_history = all_tracks_history or tracks
         
         # Pre-compute properties
-        self._track_id_counts: Counter = self._compute_track_frequencies()
+        self._track_id_counts = (
+            track_counts if track_counts is not None
+            else self._compute_track_frequencies()
+        )
+        self._compute_stats()
+    
+    @classmethod
+    def from_stats(
+        cls,
+        session_id: str,
+        tracks: List[Track],
+        stats: SessionStats,
+        index: int,
+        all_tracks_history: Optional[List[Track]] = None
+    ) -> "ListeningSession":
+        """
+        Build a session whose derived properties come from SessionStats.
+        
+        Skips re-sorting and re-scanning the tracks; used when the session
+        is a slice of an already sorted, already reduced history.
+        
+        Args:
+            session_id: Unique session identifier
+            tracks: Chronologically sorted tracks of this session
+            stats: Precomputed per-session statistics
+            index: Position of this session within stats
+            all_tracks_history: Optional full track history
+        """
+        session = cls.__new__(cls)
+        session.session_id = session_id
+        session.tracks = tracks
+        session.all_tracks_history = all_tracks_history or tracks
+        session._track_id_counts = {}
+        session._duration_minutes = float(stats.duration_minutes[index])
+        session._avg_hour = float(stats.avg_hour[index])
+        session._replay_rate = float(stats.replay_rate[index])
+        session._context_switches = int(stats.context_switches[index])
+        return session
+    
+    @classmethod
+    def from_table(
+        cls,
+        session_id: str,
+        table: TrackTable,
+        start: int,
+        end: int
+    ) -> "ListeningSession":
+        """
+        Build a session over rows start:end of a TrackTable.
+        
+        Properties are reduced from the table's column slices instead of
+        walking Track attributes; play counts come from the whole table.
+        
+        Args:
+            session_id: Unique session identifier
+            table: Track table the session is a slice of
+            start: First row of the session
+            end: One past the last row of the session
+        """
+        session = cls.__new__(cls)
+        session.session_id = session_id
+        session.tracks = table.tracks[start:end]
+        session.all_tracks_history = table.tracks
+        session._track_id_counts = {}
+        
+        if end <= start:
+            session._duration_minutes = 0.0
+            session._avg_hour = 12.0
+            session._replay_rate = 0.0
+            session._context_switches = 0
+            return session
+        
+        contexts = table.context_codes[start:end]
+        session._duration_minutes = float(table.timestamps[end - 1] - table.timestamps[start]) / 1_000_000 / 60
+        session._avg_hour = float(table.hours[start:end].mean())
+        session._replay_rate = float((table.play_counts[start:end] > 1).mean())
+        session._context_switches = int(np.unique(contexts[contexts >= 0]).size)
+        return session
     
     def _compute_track_frequencies(self) -> Counter:
         """Count play frequency of each track across all history."""
         return Counter(t.track_id for t in self.all_tracks_history)
     
+    def _compute_stats(self):
+        """Compute duration, hour, replay and context statistics in one pass."""
+        tracks = self.tracks
+        if not tracks:
+            self._duration_minutes = 0.0
+            self._avg_hour = 12.0
+            self._replay_rate = 0.0
+            self._context_switches = 0
+            return
+        
+        hour_sum = 0
+        repeated = 0
+        contexts = set()
+        for t in tracks:
+            hour_sum += t.timestamp.hour
+            if self._track_id_counts.get(t.track_id, 0) > 1:
+                repeated += 1
+            if t.context_uri:
+                contexts.add(t.context_uri)
+        
+        time_span = tracks[-1].timestamp - tracks[0].timestamp
+        self._duration_minutes = time_span.total_seconds() / 60 if len(tracks) > 1 else 0.0
+        self._avg_hour = hour_sum / len(tracks)
+        self._replay_rate = repeated / len(tracks)
+        self._context_switches = len(contexts)
+    
     @property
     def total_tracks(self) -> int:
         """Total number of tracks in this session."""
@@ -557,43 +799,22 @@ class ListeningSession:
     @property
     def duration_minutes(self) -> float:
         """Total duration of session in minutes."""
-        if len(self.tracks) < 2:
-            return 0.0
-        
-        time_span = self.tracks[-1].timestamp - self.tracks[0].timestamp
-        return time_span.total_seconds() / 60
+        return self._duration_minutes
     
     @property
     def avg_hour(self) -> float:
         """Average hour of day (0-24) for this session."""
-        if not self.tracks:
-            return 12.0
-        
-        hours = [t.timestamp.hour for t in self.tracks]
-        return sum(hours) / len(hours)
+        return self._avg_hour
     
     @property
     def replay_rate(self) -> float:
         """Fraction of tracks in session that were played before."""
-        if not self.tracks:
-            return 0.0
-        
-        repeated = sum(
-            1 for t in self.tracks 
-            if self._track_id_counts.get(t.track_id, 0) > 1
-        )
-        
-        return repeated / len(self.tracks)
+        return self._replay_rate
     
     @property
     def context_switches(self) -> int:
         """Number of unique contexts (playlists/albums) switched through."""
-        contexts = set(
-            t.context_uri 
-            for t in self.tracks 
-            if t.context_uri
-        )
-        return len(contexts)
+        return self._context_switches
     
     @property
     def start_time(self) -> datetime:
@@ -618,6 +839,15 @@ class ListeningSession:
 # ============================================================================
 
 
+def _classify_session_range(
+    classifier: "BehaviorClassifier",
+    lo: int,
+    hi: int
+) -> List[BehaviorState]:
+    """Process-pool entry point for BehaviorClassifier.classify_overall."""
+    return classifier._classify_sessions(lo, hi)
+
+
 class BehaviorClassifier:
     """
     Classify listening behavior using signal-based weighted scoring.
@@ -642,18 +872,62 @@ class BehaviorClassifier:
         "anomaly_detected": {"description": "Unusual behavioral deviation"}
     }
     
-    def __init__(self, all_tracks: List[Track]):
+    # Per-behavior session intensity (0.0-1.0); unlisted behaviors get 0.5
+    INTENSITY_RULES: Dict[str, Callable[[ListeningSession], float]] = {
+        "ruminating": lambda s: min(s.replay_rate * 1.5, 1.0),
+        "comfort_seeking": lambda s: s.replay_rate,
+        "searching": lambda s: min(s.context_switches / 5, 1.0),
+        "focused": lambda s: min(s.duration_minutes / 120, 1.0),
+        "zoning_out": lambda s: min(s.duration_minutes / 180, 1.0),
+        "casual": lambda s: min(s.duration_minutes / 10, 1.0),
+    }
+    
+    def __init__(self, all_tracks: Union[List[Track], TrackTable]):
         """
         Initialize classifier with track history.
         
         Args:
-            all_tracks: Complete track history
+            all_tracks: Complete track history, or a prebuilt TrackTable
         """
-        self.all_tracks = sorted(all_tracks, key=lambda t: t.timestamp)
+        # Columnar (SoA) view of the history, sorted once by timestamp.
+        # A TrackTable passed in is reused as-is, so analyzers built from
+        # the same table share one sort and one set of columns.
+        table = all_tracks if isinstance(all_tracks, TrackTable) else TrackTable.from_tracks(all_tracks)
+        self.table = table
+        self.all_tracks = table.tracks
+        self._ts = table.timestamps
+        self._hours = table.hours
+        self._ids = table.track_ids
+        self._unique_ids = table.unique_ids
+        self._unique_counts = table.unique_counts
+        self._play_counts = table.play_counts
+        self._ctx_codes = table.context_codes
+        self._shuffle = table.shuffle
+        self._repeat_on = table.repeat_on
+        
+        # Replay masks computed once: played more than once / more than
+        # three times (the late-night replay-loop threshold)
+        self._replay_masks = np.stack(
+            (self._play_counts > 1, self._play_counts > 3), axis=1
+        )
+        self._is_replay = self._replay_masks[:, 0]
+        self._is_heavy_replay = self._replay_masks[:, 1]
+        
+        # History-wide means used as the deviation reference
+        self._mean_hour = float(self._hours.mean()) if self._hours.size else 12.0
+        self._mean_replay_rate = float(self._is_replay.mean()) if self._is_replay.size else 0.0
+        self._track_counts: Dict[str, int] = dict(
+            zip(self._unique_ids.tolist(), self._unique_counts.tolist())
+        )
         
         # Precompute baseline from all tracks grouped into sessions
-        sessions = self._group_into_sessions(all_tracks)
-        self.baseline = BehaviorBaseline.compute(sessions, self.all_tracks)
+        self._bounds_cache: Dict[int, np.ndarray] = {}
+        self._session_stats = SessionStats.compute(
+            self._ts, self._hours, self._replay_masks, self._ctx_codes,
+            self._session_bounds()
+        )
+        self.baseline = BehaviorBaseline.from_session_stats(self._session_stats)
+        self._intensity: Optional[float] = None
         
         # Initialize all signals (add new ones here to extend)
         self.signals: List[BehaviorSignal] = [
@@ -664,6 +938,17 @@ class BehaviorClassifier:
             ConcernSignal(),
         ]
     
+    @classmethod
+    def from_table(cls, table: TrackTable) -> "BehaviorClassifier":
+        """
+        Build a classifier over an existing TrackTable without re-sorting
+        or re-extracting columns.
+        
+        Args:
+            table: Shared track table (e.g. from load_tracks_from_json)
+        """
+        return cls(table)
+    
     def classify_session(self, session_tracks: List[Track]) -> BehaviorState:
         """
         Classify behavior for a listening session using signal-based scoring.
@@ -685,26 +970,77 @@ class BehaviorClassifier:
         session = ListeningSession(
             session_id=f"session_{session_tracks[0].timestamp.isoformat()}",
             tracks=session_tracks,
-            all_tracks_history=self.all_tracks
+            all_tracks_history=self.all_tracks,
+            track_counts=self._track_counts
+        )
+        
+        return self._classify_listening_session(session)
+    
+    def classify_range(self, start: int, end: int) -> BehaviorState:
+        """
+        Classify the session made of rows start:end of the sorted history.
+        
+        Equivalent to classify_session(self.all_tracks[start:end]), but
+        session properties are read from the column slices.
+        
+        Args:
+            start: First index into self.all_tracks
+            end: One past the last index
+            
+        Returns:
+            BehaviorState with state, confidence, evidence, intensity
+        """
+        if end <= start:
+            return BehaviorState(
+                state="unknown",
+                confidence=0.0,
+                evidence=["Empty session"]
+            )
+        
+        session = ListeningSession.from_table(
+            session_id=f"session_{self.all_tracks[start].timestamp.isoformat()}",
+            table=self.table,
+            start=start,
+            end=end
         )
         
-        # Accumulate scores from all signals
-        behavior_scores: Dict[str, Tuple[float, List[str]]] = {}
+        return self._classify_listening_session(session)
+    
+    def _classify_listening_session(
+        self,
+        session: ListeningSession,
+        evaluators: Optional[List[Callable]] = None
+    ) -> BehaviorState:
+        """
+        Score a prepared ListeningSession against all signals.
         
-        for signal in self.signals:
-            signal_results = signal.evaluate(session, self.baseline, self.all_tracks)
+        Args:
+            session: Non-empty listening session
+            evaluators: Bound evaluate methods of self.signals; batch callers
+                resolve them once and reuse them for every session
+            
+        Returns:
+            BehaviorState with state, confidence, evidence, intensity
+        """
+        if evaluators is None:
+            evaluators = [signal.evaluate for signal in self.signals]
+        baseline = self.baseline
+        all_tracks = self.all_tracks
+        
+        # Accumulate [score sum, contributing signals, evidence] per behavior
+        totals: Dict[str, list] = defaultdict(lambda: [0.0, 0, []])
+        
+        for evaluate in evaluators:
+            signal_results = evaluate(session, baseline, all_tracks)
             
             for behavior, (score, evidence) in signal_results.items():
-                if behavior not in behavior_scores:
-                    behavior_scores[behavior] = (score, evidence)
-                else:
-                    # Average scores if multiple signals contribute
-                    prev_score, prev_evidence = behavior_scores[behavior]
-                    avg_score = (prev_score + score) / 2
-                    behavior_scores[behavior] = (avg_score, prev_evidence + evidence)
+                entry = totals[behavior]
+                entry[0] += score
+                entry[1] += 1
+                entry[2].extend(evidence)
         
         # If no signals fired, default to casual
-        if not behavior_scores:
+        if not totals:
             return BehaviorState(
                 state="casual",
                 confidence=0.60,
@@ -713,6 +1049,12 @@ class BehaviorClassifier:
                 secondary_behaviors=[]
             )
         
+        # Average scores if multiple signals contribute
+        behavior_scores: Dict[str, Tuple[float, List[str]]] = {
+            behavior: (score_sum / count, evidence)
+            for behavior, (score_sum, count, evidence) in totals.items()
+        }
+        
         # Sort behaviors by score (descending)
         sorted_behaviors = sorted(
             behavior_scores.items(),
@@ -750,10 +1092,15 @@ class BehaviorClassifier:
             secondary_behaviors=secondary_behaviors
         )
     
-    def classify_overall(self) -> BehaviorState:
+    def classify_overall(self, n_jobs: int = 1) -> BehaviorState:
         """
         Classify overall listening behavior across all history.
         
+        Args:
+            n_jobs: Worker processes used to score sessions. Sessions are
+                independent, so long histories can be split across cores;
+                results are merged in session order, so output is identical.
+        
         Returns:
             Overall BehaviorState (routine-driven, chronic ruminator, etc.)
         """
@@ -764,21 +1111,42 @@ class BehaviorClassifier:
                 evidence=[]
             )
         
-        # Group into sessions
-        sessions = self._group_into_sessions(self.all_tracks)
-        if not sessions:
+        # Sessions and their statistics were reduced once in __init__
+        stats = self._session_stats
+        n_sessions = stats.total_tracks.size
+        if not n_sessions:
             return BehaviorState(
                 state="unknown",
                 confidence=0.0,
                 evidence=[]
             )
         
-        # Classify each session, aggregate results
+        # Classify each session (optionally in parallel chunks)
+        if n_jobs > 1 and n_sessions > 1:
+            # Imported here: multiprocessing adds ~10ms to every CLI start
+            from concurrent.futures import ProcessPoolExecutor
+            
+            chunk_size = -(-n_sessions // n_jobs)
+            bounds = [
+                (lo, min(lo + chunk_size, n_sessions))
+                for lo in range(0, n_sessions, chunk_size)
+            ]
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                chunks = pool.map(
+                    _classify_session_range,
+                    [self] * len(bounds),
+                    [lo for lo, _ in bounds],
+                    [hi for _, hi in bounds]
+                )
+                session_states = [state for chunk in chunks for state in chunk]
+        else:
+            session_states = self._classify_sessions(0, n_sessions)
+        
+        # Aggregate results
         state_counts: Dict[str, int] = {}
         all_secondary_behaviors: Dict[str, float] = {}
         
-        for session_tracks in sessions:
-            session_state = self.classify_session(session_tracks)
+        for session_state in session_states:
             state_counts[session_state.state] = state_counts.get(session_state.state, 0) + 1
             
             # Track secondary behaviors
@@ -789,15 +1157,15 @@ class BehaviorClassifier:
         dominant_state = max(state_counts.items(), key=lambda x: x[1])
         state_name, count = dominant_state
         
-        confidence = count / len(sessions)
+        confidence = count / n_sessions
         
-        evidence = [f"Dominant in {count}/{len(sessions)} sessions ({confidence:.0%})"]
+        evidence = [f"Dominant in {count}/{n_sessions} sessions ({confidence:.0%})"]
         
         # Compute secondary behaviors (average across sessions)
         secondary_behaviors: List[Tuple[str, float]] = []
         if all_secondary_behaviors:
             secondary_avg = {
-                behavior: score / len(sessions)
+                behavior: score / n_sessions
                 for behavior, score in all_secondary_behaviors.items()
             }
             secondary_behaviors = sorted(
@@ -827,6 +1195,34 @@ class BehaviorClassifier:
             secondary_behaviors=secondary_behaviors
         )
     
+    def _classify_sessions(self, lo: int, hi: int) -> List[BehaviorState]:
+        """
+        Classify the precomputed sessions lo..hi-1 of the history.
+        
+        Args:
+            lo: Index of the first session
+            hi: Index one past the last session
+            
+        Returns:
+            One BehaviorState per session, in session order
+        """
+        stats = self._session_stats
+        evaluators = [signal.evaluate for signal in self.signals]
+        states = []
+        
+        for i in range(lo, hi):
+            session_tracks = self.all_tracks[int(stats.starts[i]):int(stats.ends[i])]
+            session = ListeningSession.from_stats(
+                session_id=f"session_{session_tracks[0].timestamp.isoformat()}",
+                tracks=session_tracks,
+                stats=stats,
+                index=i,
+                all_tracks_history=self.all_tracks
+            )
+            states.append(self._classify_listening_session(session, evaluators))
+        
+        return states
+    
     def _compute_intensity(self, session: ListeningSession, behavior: str) -> float:
         """
         Compute intensity for a specific behavior in a session.
@@ -838,43 +1234,42 @@ class BehaviorClassifier:
         Returns:
             0.0-1.0 intensity score
         """
-        if behavior == "ruminating":
-            return min(session.replay_rate * 1.5, 1.0)
-        elif behavior == "comfort_seeking":
-            return session.replay_rate
-        elif behavior == "searching":
-            return min(session.context_switches / 5, 1.0)
-        elif behavior == "focused":
-            return min(session.duration_minutes / 120, 1.0)
-        elif behavior == "zoning_out":
-            return min(session.duration_minutes / 180, 1.0)
-        elif behavior == "casual":
-            return min(session.duration_minutes / 10, 1.0)
-        else:
-            return 0.5
+        rule = self.INTENSITY_RULES.get(behavior)
+        return rule(session) if rule is not None else 0.5
     
     def _compute_overall_intensity(self) -> float:
-        """Compute overall listening intensity across all history."""
+        """
+        Compute overall listening intensity across all history.
+        
+        Every component reads from columns and session stats built in
+        __init__, and the history is immutable, so the score is computed
+        once and reused.
+        """
+        if self._intensity is None:
+            self._intensity = self._intensity_from_columns()
+        return self._intensity
+    
+    def _intensity_from_columns(self) -> float:
+        """Weighted frequency / session length / replay intensity score."""
         if not self.all_tracks:
             return 0.0
         
         # Frequency component (tracks per day)
-        time_span_days = (self.all_tracks[-1].timestamp - self.all_tracks[0].timestamp).days + 1
+        time_span_days = int((self._ts[-1] - self._ts[0]) // _MICROS_PER_DAY) + 1
         tracks_per_day = len(self.all_tracks) / time_span_days
         frequency_score = min(tracks_per_day / 50, 1.0)  # Cap at 50 tracks/day
         
         # Session length component
-        sessions = self._group_into_sessions(self.all_tracks)
-        if sessions:
-            avg_session_tracks = sum(len(s) for s in sessions) / len(sessions)
+        n_sessions = self._session_stats.total_tracks.size
+        if n_sessions:
+            avg_session_tracks = len(self.all_tracks) / n_sessions
             session_score = min(avg_session_tracks / 30, 1.0)  # Cap at 30 tracks/session
         else:
             session_score = 0.0
         
         # Replay component
-        track_counts = Counter(t.track_id for t in self.all_tracks)
         replay_score = min(
-            sum(1 for c in track_counts.values() if c > 1) / len(track_counts),
+            int(np.count_nonzero(self._unique_counts > 1)) / self._unique_counts.size,
             1.0
         )
         
@@ -883,41 +1278,72 @@ class BehaviorClassifier:
         
         return round(intensity, 3)
     
-    def _group_into_sessions(
-        self,
-        tracks: List[Track],
-        gap_minutes: int = 30
-    ) -> List[List[Track]]:
+    def _lookup_play_counts(self, tracks: List[Track]) -> np.ndarray:
+        """History play counts for arbitrary tracks (0 if never seen)."""
+        ids = np.array([t.track_id for t in tracks], dtype=str)
+        if not self._unique_ids.size:
+            return np.zeros(len(ids), dtype=np.int64)
+        
+        pos = np.searchsorted(self._unique_ids, ids).clip(max=self._unique_ids.size - 1)
+        return np.where(self._unique_ids[pos] == ids, self._unique_counts[pos], 0)
+    
+    def _session_bounds(self, gap_minutes: int = 30) -> np.ndarray:
         """
-        Group tracks into sessions based on time gaps.
+        Session boundary indices into the sorted history.
         
         Args:
-            tracks: Tracks to group
             gap_minutes: Minutes between tracks before new session
             
+        The history is immutable after __init__, so bounds are cached per
+        gap and returned read-only.
+        
         Returns:
-            List of session track lists
+            int64 array; session i spans bounds[i]:bounds[i + 1]
+            (a single 0 when there is no history)
         """
-        if not tracks:
-            return []
+        bounds = self._bounds_cache.get(gap_minutes)
+        if bounds is not None:
+            return bounds
+        
+        if self._ts.size:
+            # A new session starts wherever the gap to the previous track is too long
+            gaps = np.diff(self._ts)
+            cut_points = np.flatnonzero(gaps > gap_minutes * 60_000_000) + 1
+            bounds = np.concatenate(([0], cut_points, [self._ts.size])).astype(np.int64)
+        else:
+            bounds = np.zeros(1, dtype=np.int64)
         
-        sorted_tracks = sorted(tracks, key=lambda t: t.timestamp)
-        sessions = []
-        current_session = [sorted_tracks[0]]
+        bounds.setflags(write=False)
+        self._bounds_cache[gap_minutes] = bounds
+        return bounds
+    
+    def _group_into_sessions(self, gap_minutes: int = 30) -> Iterator[Tuple[int, int]]:
+        """
+        Group the (sorted) history into sessions based on time gaps.
         
-        for track in sorted_tracks[1:]:
-            gap = (track.timestamp - current_session[-1].timestamp).total_seconds() / 60
-            
-            if gap <= gap_minutes:
-                current_session.append(track)
-            else:
-                sessions.append(current_session)
-                current_session = [track]
+        Yields sessions lazily as index ranges, so consumers only hold
+        one session's slice at a time.
         
-        if current_session:
-            sessions.append(current_session)
+        Args:
+            gap_minutes: Minutes between tracks before new session
+            
+        Yields:
+            (start, end) index pairs into self.all_tracks
+        """
+        bounds = self._session_bounds(gap_minutes).tolist()
+        yield from zip(bounds[:-1], bounds[1:])
+    
+    def _sessions_list(self, gap_minutes: int = 30) -> List[List[Track]]:
+        """
+        Group tracks into sessions, materialized as Track lists.
         
-        return sessions
+        Args:
+            gap_minutes: Minutes between tracks before new session
+            
+        Returns:
+            List of session track lists
+        """
+        return [self.all_tracks[start:end] for start, end in self._group_into_sessions(gap_minutes)]
     
     # ========================================================================
     # BACKWARD COMPATIBILITY METHODS (for roast_engine integration)
@@ -934,54 +1360,66 @@ class BehaviorClassifier:
         """
         events = []
         
-        # Group into sessions
-        sessions = self._group_into_sessions(self.all_tracks)
+        stats = self._session_stats
+        if not stats.total_tracks.size:
+            return events
+        
+        # Evaluate every rule for all sessions at once as boolean masks
+        starts, ends, lengths = stats.starts, stats.ends, stats.total_tracks
+        span_seconds = (self._ts[ends - 1] - self._ts[starts]) / 1_000_000
+        
+        is_late_night_replay = (
+            ((stats.avg_hour >= 22) | (stats.avg_hour <= 3)) & (lengths > 5) & (stats.heavy_replays > 0)
+        )
+        is_skip_spree = stats.context_switches > 5
+        is_comfort_loop = (
+            (lengths > 8)
+            & (np.add.reduceat(self._shuffle == 1, starts) == 0)
+            & (np.add.reduceat(self._repeat_on, starts) > 0)
+        )
+        is_binge = span_seconds / 3600 > 4
         
-        # Precompute track counts
-        track_counts = Counter(t.track_id for t in self.all_tracks)
+        flagged = is_late_night_replay | is_skip_spree | is_comfort_loop | is_binge
         
-        for session in sessions:
+        # Only sessions that tripped a rule are materialized as event dicts
+        for i in np.flatnonzero(flagged).tolist():
+            start, end = int(starts[i]), int(ends[i])
+            session = self.all_tracks[start:end]
+            
             # Late night replay loop
-            avg_hour = sum(t.timestamp.hour for t in session) / len(session)
-            if (22 <= avg_hour or avg_hour <= 3) and len(session) > 5:
-                replays = [t for t in session if track_counts[t.track_id] > 3]
-                if replays:
-                    events.append({
-                        "type": "late_night_replay",
-                        "timestamp": session[0].timestamp,
-                        "track": replays[0].song_name,
-                        "count": track_counts[replays[0].track_id],
-                        "hour": int(avg_hour)
-                    })
+            if is_late_night_replay[i]:
+                first = int(np.argmax(self._is_heavy_replay[start:end]))
+                events.append({
+                    "type": "late_night_replay",
+                    "timestamp": session[0].timestamp,
+                    "track": session[first].song_name,
+                    "count": int(self._play_counts[start + first]),
+                    "hour": int(stats.avg_hour[i])
+                })
             
             # Skip spree (context switches indicate skipping)
-            contexts = [t.context_uri for t in session if t.context_uri]
-            if len(set(contexts)) > 5:
+            if is_skip_spree[i]:
                 events.append({
                     "type": "skip_spree",
                     "timestamp": session[0].timestamp,
-                    "switches": len(set(contexts)),
+                    "switches": int(stats.context_switches[i]),
                     "tracks": len(session)
                 })
             
             # Comfort loop (repeat + shuffle off)
-            shuffle_off = all(not t.shuffle_state for t in session if t.shuffle_state is not None)
-            repeat_on = any(t.repeat_state != "off" for t in session if t.repeat_state)
-            
-            if shuffle_off and repeat_on and len(session) > 8:
+            if is_comfort_loop[i]:
                 events.append({
                     "type": "comfort_loop",
                     "timestamp": session[0].timestamp,
-                    "duration_min": (session[-1].timestamp - session[0].timestamp).total_seconds() / 60
+                    "duration_min": float(span_seconds[i]) / 60
                 })
             
             # Binge session
-            duration_hours = (session[-1].timestamp - session[0].timestamp).total_seconds() / 3600
-            if duration_hours > 4:
+            if is_binge[i]:
                 events.append({
                     "type": "binge_session",
                     "timestamp": session[0].timestamp,
-                    "duration_hours": duration_hours,
+                    "duration_hours": float(span_seconds[i]) / 3600,
                     "tracks": len(session)
                 })
         
@@ -999,32 +1437,46 @@ class BehaviorClassifier:
         """
         return self._compute_overall_intensity()
     
-    def get_deviation_score(self, recent_tracks: List[Track]) -> float:
+    def get_deviation_score(
+        self,
+        recent_tracks: Optional[List[Track]] = None,
+        since: Optional[datetime] = None
+    ) -> float:
         """
         Calculate how much recent behavior deviates from baseline.
         
+        Pass either an explicit list of recent tracks, or a `since` cutoff
+        to use the tail of this classifier's own history (sliced straight
+        out of the sorted columns, no per-track work).
+        
         Args:
             recent_tracks: Recent listening history
+            since: Treat history at or after this timestamp as recent
             
         Returns:
             Deviation score (0.0 = consistent, 1.0 = very different)
         """
-        if len(recent_tracks) < 5 or len(self.all_tracks) < 20:
+        if since is not None:
+            cutoff = int(np.searchsorted(self._ts, _to_micros(since), side="left"))
+            recent_hours = self._hours[cutoff:]
+            recent_replays = self._is_replay[cutoff:]
+        else:
+            recent_tracks = recent_tracks or []
+            recent_hours = _hour_column(_timestamp_micros(recent_tracks))
+            recent_replays = self._lookup_play_counts(recent_tracks) > 1
+        
+        if recent_hours.size < 5 or len(self.all_tracks) < 20:
             return 0.0
         
         # Calculate baseline patterns
-        baseline_hours = [t.timestamp.hour for t in self.all_tracks]
-        recent_hours = [t.timestamp.hour for t in recent_tracks]
-        
-        baseline_avg_hour = sum(baseline_hours) / len(baseline_hours)
-        recent_avg_hour = sum(recent_hours) / len(recent_hours)
+        baseline_avg_hour = self._mean_hour
+        recent_avg_hour = float(recent_hours.mean())
         
         hour_deviation = abs(baseline_avg_hour - recent_avg_hour) / 24
         
         # Replay deviation
-        track_counts = Counter(t.track_id for t in self.all_tracks)
-        baseline_replay_rate = sum(track_counts[t.track_id] > 1 for t in self.all_tracks) / len(self.all_tracks)
-        recent_replay_rate = sum(track_counts[t.track_id] > 1 for t in recent_tracks) / len(recent_tracks)
+        baseline_replay_rate = self._mean_replay_rate
+        recent_replay_rate = float(recent_replays.mean())
         
         replay_deviation = abs(baseline_replay_rate - recent_replay_rate)
         
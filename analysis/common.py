@@ -0,0 +1,157 @@
+"""
+Shared columnar track storage for the analyzers.
+
+Architecture:
+- TrackTable: Tracks sorted once by timestamp, plus NumPy columns
+  (timestamps, hours, ids, play counts, contexts, playback modes)
+- Column helpers: Timestamp -> int64 microsecond / int8 hour / int8
+  weekday conversion
+- _memoized: Per-instance caching for zero-argument analyzer methods
+
+Benefits:
+- Built once, shared by every analyzer constructed from the same history
+- Behaves like a read-only list of Track objects for existing callers
+"""
+
+import functools
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterator, List
+
+import numpy as np
+
+from core.models import Track
+
+
+# Wall-clock timestamps are stored as int64 microseconds since this epoch
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_MICROS_PER_HOUR = 3_600_000_000
+_MICROS_PER_DAY = 24 * _MICROS_PER_HOUR
+
+
+def _to_micros(timestamp: datetime) -> int:
+    """Wall-clock microseconds since the epoch (timezone offset ignored)."""
+    return (timestamp.replace(tzinfo=None) - _EPOCH) // _MICROSECOND
+
+
+def _timestamp_micros(tracks: List[Track]) -> np.ndarray:
+    """
+    Extract track timestamps as an int64 microsecond column.
+
+    Timezone offsets are ignored so the column matches the wall-clock
+    values the tracks were logged with (hour-of-day stays exact).
+    """
+    return np.fromiter(
+        (_to_micros(t.timestamp) for t in tracks),
+        dtype=np.int64,
+        count=len(tracks)
+    )
+
+
+def _hour_column(timestamps: np.ndarray) -> np.ndarray:
+    """Hour of day (0-23) as an int8 column, from int64 microseconds."""
+    return (timestamps // _MICROS_PER_HOUR % 24).astype(np.int8)
+
+
+def _weekday_column(timestamps: np.ndarray) -> np.ndarray:
+    """Day of week (Monday=0) as an int8 column, from int64 microseconds."""
+    # 1970-01-01, day 0 of the column, was a Thursday
+    return ((timestamps // _MICROS_PER_DAY + 3) % 7).astype(np.int8)
+
+
+def _memoized(method):
+    """
+    Cache a zero-argument analyzer method's result on the instance.
+    
+    Results are kept in the instance's `_results` dict, keyed by method
+    name, and must be treated as read-only by callers.
+    """
+    @functools.wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._results:
+            self._results[method.__name__] = method(self)
+        return self._results[method.__name__]
+    return wrapper
+
+
+@dataclass(eq=False)
+class TrackTable(Sequence):
+    """
+    Track history sorted by timestamp, with columnar (SoA) views.
+
+    Indexing, slicing, iteration and len() go through the sorted Track
+    list, so a table can be passed anywhere a List[Track] is expected.
+    Columns are aligned with `tracks` and must be treated as read-only.
+    """
+    tracks: List[Track]
+    timestamps: np.ndarray      # int64 wall-clock microseconds
+    hours: np.ndarray           # int8 hour of day
+    track_ids: np.ndarray       # str track ids
+    unique_ids: np.ndarray      # sorted distinct track ids
+    unique_counts: np.ndarray   # plays per distinct id
+    play_counts: np.ndarray     # plays of each track's id across history
+    context_codes: np.ndarray   # int32 interned context_uri, -1 for none
+    shuffle: np.ndarray         # int8 shuffle state: 1 on, 0 off, -1 unknown
+    repeat_on: np.ndarray       # bool, repeat mode other than "off"
+
+    @classmethod
+    def from_tracks(cls, tracks: List[Track]) -> "TrackTable":
+        """
+        Sort tracks and extract every column in one go.
+
+        Args:
+            tracks: Track history in any order
+
+        Returns:
+            TrackTable over the chronologically sorted tracks
+        """
+        # Stable argsort keeps the ordering identical to sorted()
+        timestamps = _timestamp_micros(tracks)
+        order = np.argsort(timestamps, kind="stable")
+        sorted_tracks = [tracks[i] for i in order]
+        timestamps = timestamps[order]
+        track_ids = np.array([t.track_id for t in sorted_tracks], dtype=str)
+
+        # Play counts via one np.unique pass
+        unique_ids, id_codes, unique_counts = np.unique(
+            track_ids, return_inverse=True, return_counts=True
+        )
+
+        # Contexts interned as int32 codes; tracks without a context get -1
+        contexts = np.array([t.context_uri or "" for t in sorted_tracks], dtype=str)
+        context_values, context_codes = np.unique(contexts, return_inverse=True)
+        context_codes = context_codes.astype(np.int32)
+        if context_values.size and context_values[0] == "":
+            context_codes -= 1
+
+        return cls(
+            tracks=sorted_tracks,
+            timestamps=timestamps,
+            hours=_hour_column(timestamps),
+            track_ids=track_ids,
+            unique_ids=unique_ids,
+            unique_counts=unique_counts,
+            play_counts=unique_counts[id_codes],
+            context_codes=context_codes,
+            shuffle=np.fromiter(
+                (-1 if t.shuffle_state is None else int(bool(t.shuffle_state)) for t in sorted_tracks),
+                dtype=np.int8,
+                count=len(sorted_tracks)
+            ),
+            repeat_on=np.fromiter(
+                (bool(t.repeat_state) and t.repeat_state != "off" for t in sorted_tracks),
+                dtype=bool,
+                count=len(sorted_tracks)
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.tracks)
+
+    def __getitem__(self, index):
+        return self.tracks[index]
+
+    def __iter__(self) -> Iterator[Track]:
+        return iter(self.tracks)
@@ -9,27 +9,95 @@ Analyzes patterns like:
 """
 
 from datetime import datetime, timedelta
-from typing import List, Dict
-from collections import Counter, defaultdict
+from typing import List, Dict, Optional, Tuple, Union
 import statistics
 
+import numpy as np
+
 from core.models import Track
+from analysis.common import (
+    TrackTable,
+    _EPOCH,
+    _MICROS_PER_DAY,
+    _hour_column,
+    _memoized,
+    _timestamp_micros,
+    _weekday_column,
+)
+
+
+def _rank_counts(
+    distinct: np.ndarray,
+    first_seen: np.ndarray,
+    counts: np.ndarray,
+    limit: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Order np.unique output by count, most common first.
+    
+    Ties keep first-seen order, matching Counter.most_common(). With a
+    limit, only values at or above the limit-th largest count are sorted
+    (selected with np.partition in linear time).
+    """
+    if limit is not None:
+        limit = max(limit, 0)
+        if limit < counts.size:
+            cutoff = np.partition(counts, counts.size - limit)[counts.size - limit] if limit else counts.max() + 1
+            keep = np.flatnonzero(counts >= cutoff)
+            distinct, first_seen, counts = distinct[keep], first_seen[keep], counts[keep]
+    
+    order = np.lexsort((first_seen, -counts))[:limit]
+    return distinct[order], counts[order]
+
+
+def _ranked_counts(values: np.ndarray, limit: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct values and their counts, most common first (see _rank_counts)."""
+    return _rank_counts(*np.unique(values, return_index=True, return_counts=True), limit=limit)
 
 
 class HabitsAnalyzer:
     """
     Analyze listening behavior patterns and habits.
+    
+    Summaries that depend only on the history are computed once per
+    analyzer and must be treated as read-only; build a new HabitsAnalyzer
+    when the track history changes.
     """
     
-    def __init__(self, tracks: List[Track]):
+    def __init__(self, tracks: Union[List[Track], TrackTable]):
         """
         Initialize analyzer with track history.
         
         Args:
-            tracks: List of Track objects
+            tracks: List of Track objects, or a prebuilt TrackTable
         """
         self.tracks = tracks
+        
+        # Columns extracted once, aligned with self.tracks; a TrackTable's
+        # timestamp/hour/id columns are reused instead of re-extracted
+        n = len(tracks)
+        if isinstance(tracks, TrackTable):
+            self._ts = tracks.timestamps
+            self._hours = tracks.hours
+            self._track_ids = tracks.track_ids
+        else:
+            self._ts = _timestamp_micros(tracks)
+            self._hours = _hour_column(self._ts)
+            self._track_ids = np.array([t.track_id for t in tracks], dtype=str)
+        self._weekdays = _weekday_column(self._ts)
+        self._artists = np.array([t.artist for t in tracks], dtype=str)
+        self._context_types = np.array([t.context_type or "unknown" for t in tracks], dtype=str)
+        self._shuffle_on = np.fromiter((t.shuffle_state is True for t in tracks), dtype=bool, count=n)
+        self._duration_ms = np.fromiter((t.duration_ms for t in tracks), dtype=np.int64, count=n)
+        
+        # First occurrence of each track_id, for O(1) detail lookups
+        self._track_by_id: Dict[str, Track] = {}
+        for track in tracks:
+            self._track_by_id.setdefault(track.track_id, track)
+        
+        self._results: Dict[str, object] = {}
     
+    @_memoized
     def get_listening_hours(self) -> Dict:
         """
         Analyze most active listening hours.
@@ -37,12 +105,11 @@ class HabitsAnalyzer:
         Returns:
             Dictionary with hour distribution and peak times
         """
-        hour_counts = Counter(track.timestamp.hour for track in self.tracks)
-        
-        if not hour_counts:
+        if not self._hours.size:
             return {"error": "No tracks found"}
         
-        total = sum(hour_counts.values())
+        hour_counts = np.bincount(self._hours, minlength=24)
+        total = int(self._hours.size)
         
         # Convert to percentage and sort
         hour_distribution = {
@@ -50,11 +117,13 @@ class HabitsAnalyzer:
                 "count": count,
                 "percentage": round((count / total) * 100, 1)
             }
-            for hour, count in sorted(hour_counts.items())
+            for hour, count in enumerate(hour_counts.tolist())
+            if count
         }
         
         # Find peak hours (top 3)
-        top_hours = hour_counts.most_common(3)
+        hours, counts = _ranked_counts(self._hours, limit=3)
+        top_hours = list(zip(hours.tolist(), counts.tolist()))
         
         return {
             "total_tracks": total,
@@ -66,6 +135,7 @@ class HabitsAnalyzer:
             "most_active_hour": top_hours[0][0] if top_hours else None
         }
     
+    @_memoized
     def get_day_of_week_pattern(self) -> Dict:
         """
         Analyze listening patterns by day of week.
@@ -78,34 +148,34 @@ class HabitsAnalyzer:
             "Friday", "Saturday", "Sunday"
         ]
         
-        day_counts = Counter(track.timestamp.weekday() for track in self.tracks)
-        
-        if not day_counts:
+        if not self._weekdays.size:
             return {"error": "No tracks found"}
         
-        total = sum(day_counts.values())
+        day_counts = np.bincount(self._weekdays, minlength=7).tolist()
+        total = int(self._weekdays.size)
         
         distribution = {
             day_names[day]: {
-                "count": day_counts.get(day, 0),
-                "percentage": round((day_counts.get(day, 0) / total) * 100, 1)
+                "count": day_counts[day],
+                "percentage": round((day_counts[day] / total) * 100, 1)
             }
             for day in range(7)
         }
         
-        most_active_day = max(day_counts.items(), key=lambda x: x[1])
+        # Ties go to the day listened on first
+        most_active_day = int(_ranked_counts(self._weekdays, limit=1)[0][0])
         
         return {
             "total_tracks": total,
             "distribution": distribution,
-            "most_active_day": day_names[most_active_day[0]],
+            "most_active_day": day_names[most_active_day],
             "is_weekend_listener": self._is_weekend_listener(day_counts)
         }
     
-    def _is_weekend_listener(self, day_counts: Counter) -> bool:
+    def _is_weekend_listener(self, day_counts: List[int]) -> bool:
         """Determine if user primarily listens on weekends."""
-        weekend = day_counts.get(5, 0) + day_counts.get(6, 0)
-        weekday = sum(day_counts.get(i, 0) for i in range(5))
+        weekend = day_counts[5] + day_counts[6]
+        weekday = sum(day_counts[:5])
         
         if weekend + weekday == 0:
             return False
@@ -122,7 +192,7 @@ class HabitsAnalyzer:
         Returns:
             List of artists with play counts
         """
-        artist_counts = Counter(track.artist for track in self.tracks)
+        artists, counts = _ranked_counts(self._artists, limit=limit)
         
         total = len(self.tracks)
         
@@ -132,7 +202,7 @@ class HabitsAnalyzer:
                 "play_count": count,
                 "percentage": round((count / total) * 100, 1)
             }
-            for artist, count in artist_counts.most_common(limit)
+            for artist, count in zip(artists.tolist(), counts.tolist())
         ]
     
     def get_listening_streaks(self) -> Dict:
@@ -145,50 +215,36 @@ class HabitsAnalyzer:
         if not self.tracks:
             return {"error": "No tracks found"}
         
-        # Get unique days
-        days = sorted(set(
-            track.timestamp.date()
-            for track in self.tracks
-        ))
+        # Get unique days (sorted day numbers since the epoch)
+        days = np.unique(self._ts // _MICROS_PER_DAY)
         
-        if not days:
+        if not days.size:
             return {"error": "No listening days found"}
         
-        # Calculate streaks
-        streaks = []
-        current_streak = 1
-        
-        for i in range(1, len(days)):
-            if (days[i] - days[i-1]).days == 1:
-                current_streak += 1
-            else:
-                if current_streak > 1:
-                    streaks.append(current_streak)
-                current_streak = 1
+        # Calculate streaks: runs of consecutive days, split wherever the
+        # gap to the previous listening day is more than one day
+        run_starts = np.flatnonzero(np.diff(days) != 1) + 1
+        run_lengths = np.diff(np.concatenate(([0], run_starts, [days.size])))
+        streaks = run_lengths[run_lengths > 1].tolist()
         
-        if current_streak > 1:
-            streaks.append(current_streak)
+        # Calculate current streak (the last run, if it reaches today)
+        today = (datetime.now().date() - _EPOCH.date()).days
+        current_active_streak = int(run_lengths[-1]) if days[-1] == today else 0
         
-        # Calculate current streak
-        today = datetime.now().date()
-        current_active_streak = 0
-        
-        for i in range(len(days) - 1, -1, -1):
-            if (today - days[i]).days == current_active_streak:
-                current_active_streak += 1
-            else:
-                break
+        first_day = _EPOCH.date() + timedelta(days=int(days[0]))
+        last_day = _EPOCH.date() + timedelta(days=int(days[-1]))
         
         return {
-            "total_listening_days": len(days),
+            "total_listening_days": int(days.size),
             "total_streaks": len(streaks),
             "longest_streak": max(streaks) if streaks else 1,
             "average_streak": round(statistics.mean(streaks), 1) if streaks else 1,
             "current_streak": current_active_streak,
-            "first_listen": days[0].isoformat(),
-            "last_listen": days[-1].isoformat()
+            "first_listen": first_day.isoformat(),
+            "last_listen": last_day.isoformat()
         }
     
+    @_memoized
     def get_session_patterns(self) -> Dict:
         """
         Analyze listening session patterns.
@@ -196,40 +252,22 @@ class HabitsAnalyzer:
         Returns:
             Dictionary with session statistics
         """
-        # Group tracks by session (30 min gap = new session)
-        sessions = []
-        current_session = []
-        
-        sorted_tracks = sorted(self.tracks, key=lambda t: t.timestamp)
-        
-        for track in sorted_tracks:
-            if not current_session:
-                current_session.append(track)
-            else:
-                last_track = current_session[-1]
-                gap = (track.timestamp - last_track.timestamp).total_seconds() / 60
-                
-                if gap <= 30:
-                    current_session.append(track)
-                else:
-                    if current_session:
-                        sessions.append(current_session)
-                    current_session = [track]
-        
-        if current_session:
-            sessions.append(current_session)
-        
-        if not sessions:
+        if not self._ts.size:
             return {"error": "No sessions found"}
         
-        session_lengths = [len(s) for s in sessions]
+        # Group tracks by session (30 min gap = new session)
+        order = np.argsort(self._ts, kind="stable")
+        sorted_ts = self._ts[order]
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_ts) > 30 * 60_000_000) + 1))
+        
+        session_lengths = np.diff(np.append(starts, sorted_ts.size)).tolist()
         session_durations = [
-            sum(t.duration_ms for t in s) / 60000  # Convert to minutes
-            for s in sessions
+            total_ms / 60000  # Convert to minutes
+            for total_ms in np.add.reduceat(self._duration_ms[order], starts).tolist()
         ]
         
         return {
-            "total_sessions": len(sessions),
+            "total_sessions": len(session_lengths),
             "avg_tracks_per_session": round(statistics.mean(session_lengths), 1),
             "avg_session_duration_min": round(statistics.mean(session_durations), 1),
             "longest_session_tracks": max(session_lengths),
@@ -238,6 +276,7 @@ class HabitsAnalyzer:
             "total_listening_time_hours": round(sum(session_durations) / 60, 1)
         }
     
+    @_memoized
     def get_repeat_behavior(self) -> Dict:
         """
         Analyze track repetition patterns.
@@ -245,41 +284,41 @@ class HabitsAnalyzer:
         Returns:
             Dictionary with repeat statistics
         """
-        track_counts = Counter(track.track_id for track in self.tracks)
-        
-        repeat_tracks = {
-            track_id: count
-            for track_id, count in track_counts.items()
-            if count > 1
-        }
+        track_ids, first_seen, counts = np.unique(
+            self._track_ids, return_index=True, return_counts=True
+        )
+        unique_tracks = int(track_ids.size)
+        repeated_tracks = int(np.count_nonzero(counts > 1))
         
-        if not repeat_tracks:
+        if not repeated_tracks:
             return {
-                "total_unique_tracks": len(track_counts),
+                "total_unique_tracks": unique_tracks,
                 "repeated_tracks": 0,
                 "repeat_percentage": 0
             }
         
         # Find most repeated tracks
+        top_ids, top_counts = _rank_counts(track_ids, first_seen, counts, limit=min(5, repeated_tracks))
         most_repeated = []
-        for track_id in sorted(repeat_tracks, key=repeat_tracks.get, reverse=True)[:5]:
+        for track_id, count in zip(top_ids.tolist(), top_counts.tolist()):
             # Find track details
-            track = next((t for t in self.tracks if t.track_id == track_id), None)
+            track = self._track_by_id.get(track_id)
             if track:
                 most_repeated.append({
                     "song": track.song_name,
                     "artist": track.artist,
-                    "play_count": repeat_tracks[track_id]
+                    "play_count": count
                 })
         
         return {
-            "total_unique_tracks": len(track_counts),
-            "repeated_tracks": len(repeat_tracks),
-            "repeat_percentage": round((len(repeat_tracks) / len(track_counts)) * 100, 1),
+            "total_unique_tracks": unique_tracks,
+            "repeated_tracks": repeated_tracks,
+            "repeat_percentage": round((repeated_tracks / unique_tracks) * 100, 1),
             "most_repeated": most_repeated,
-            "diversity_score": round(len(track_counts) / len(self.tracks), 3)
+            "diversity_score": round(unique_tracks / len(self.tracks), 3)
         }
     
+    @_memoized
     def get_context_preferences(self) -> Dict:
         """
         Analyze playback context preferences (playlist, album, etc.).
@@ -287,14 +326,11 @@ class HabitsAnalyzer:
         Returns:
             Dictionary with context distribution
         """
-        context_counts = Counter(
-            track.context_type if track.context_type else "unknown"
-            for track in self.tracks
-        )
+        contexts, counts = _ranked_counts(self._context_types)
         
         total = len(self.tracks)
         
-        shuffle_count = sum(1 for t in self.tracks if t.shuffle_state is True)
+        shuffle_count = int(np.count_nonzero(self._shuffle_on))
         
         return {
             "total_tracks": total,
@@ -303,7 +339,7 @@ class HabitsAnalyzer:
                     "count": count,
                     "percentage": round((count / total) * 100, 1)
                 }
-                for context, count in context_counts.most_common()
+                for context, count in zip(contexts.tolist(), counts.tolist())
             },
             "shuffle_usage": {
                 "count": shuffle_count,
@@ -1,13 +1,66 @@
+"""
+Mood analysis module - Track energy and valence trends over time.
+
+Analyzes:
+- Daily mood patterns
+- Mood shifts during sessions
+- Energy/valence trajectories
+- Correlation between mood and listening behavior
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, Tuple
+from collections import defaultdict
+import statistics
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from core.models import Track, AudioFeatures, BehaviorSignal
+from core.features import (
+    calculate_mood_score,
+    calculate_mood_score_batch,
+    get_vibe_emoji,
+    get_vibe_emoji_batch,
+)
+from analysis.common import (
+    TrackTable,
+    _EPOCH,
+    _MICROS_PER_DAY,
+    _hour_column,
+    _memoized,
+    _timestamp_micros,
+)
+
+
 # MoodScoringEngine: Accepts signals, computes averages, delegates to existing logic
 class MoodScoringEngine:
     def __init__(self, signals: list[BehaviorSignal]):
         self.signals = signals
+        # Split signals into value arrays in a single pass
+        energies, valences = [], []
+        for s in signals:
+            if s.name == "energy":
+                energies.append(s.value)
+            elif s.name == "valence":
+                valences.append(s.value)
+        self.energies = np.array(energies, dtype=np.float64)
+        self.valences = np.array(valences, dtype=np.float64)
+
+    @classmethod
+    def from_arrays(cls, energies: np.ndarray, valences: np.ndarray) -> "MoodScoringEngine":
+        """Build an engine straight from energy/valence arrays (no signal objects)."""
+        engine = cls.__new__(cls)
+        engine.signals = []
+        engine.energies = energies
+        engine.valences = valences
+        return engine
 
     def get_avg_energy_valence(self) -> tuple[float, float]:
-        energies = [s.value for s in self.signals if s.name == "energy"]
-        valences = [s.value for s in self.signals if s.name == "valence"]
-        avg_energy = statistics.mean(energies) if energies else 0.0
-        avg_valence = statistics.mean(valences) if valences else 0.0
+        avg_energy = float(self.energies.mean()) if self.energies.size else 0.0
+        avg_valence = float(self.valences.mean()) if self.valences.size else 0.0
         return avg_energy, avg_valence
 
     def calculate_mood(self):
@@ -15,7 +68,8 @@ class MoodScoringEngine:
         mood = calculate_mood_score(avg_energy, avg_valence)
         emoji = get_vibe_emoji(avg_energy, avg_valence)
         return mood, emoji, avg_energy, avg_valence
-from core.models import BehaviorSignal
+
+
 # Helper: Convert AudioFeatures to list[BehaviorSignal]
 def audio_features_to_signals(audio_features) -> list:
     """
@@ -28,24 +82,6 @@ def audio_features_to_signals(audio_features) -> list:
         BehaviorSignal(name="energy", value=audio_features.energy, source="audio_features", confidence=1.0),
         BehaviorSignal(name="valence", value=audio_features.valence, source="audio_features", confidence=1.0)
     ]
-"""
-Mood analysis module - Track energy and valence trends over time.
-
-Analyzes:
-- Daily mood patterns
-- Mood shifts during sessions
-- Energy/valence trajectories
-- Correlation between mood and listening behavior
-"""
-
-import json
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Tuple
-from collections import defaultdict
-import statistics
-
-from core.models import Track
-from core.features import calculate_mood_score, get_vibe_emoji
 
 
 class MoodAnalyzer:
@@ -55,6 +91,9 @@ class MoodAnalyzer:
     Mood is calculated from audio features:
     - Energy: Intensity level (0.0-1.0)
     - Valence: Musical positivity (0.0-1.0)
+    
+    Summary results are computed once per analyzer and must be treated as
+    read-only; build a new MoodAnalyzer when the track history changes.
     """
     
     def __init__(self, tracks: List[Track]):
@@ -68,7 +107,21 @@ class MoodAnalyzer:
         self.tracks_with_features = [
             t for t in tracks if t.audio_features is not None
         ]
+        
+        # Feature columns (SoA), aligned with self.tracks_with_features
+        n = len(self.tracks_with_features)
+        features = [t.audio_features for t in self.tracks_with_features]
+        self._energy = np.fromiter((f.energy for f in features), dtype=np.float64, count=n)
+        self._valence = np.fromiter((f.valence for f in features), dtype=np.float64, count=n)
+        self._tempo = np.fromiter((f.tempo for f in features), dtype=np.float64, count=n)
+        self._ts = _timestamp_micros(self.tracks_with_features)
+        self._hours = _hour_column(self._ts)
+        # Distinct days (days since epoch) and each track's day code
+        self._days, self._day_codes = np.unique(self._ts // _MICROS_PER_DAY, return_inverse=True)
+        
+        self._results: Dict[str, object] = {}
     
+    @_memoized
     def get_overall_mood(self) -> Dict:
         """
         Calculate overall mood statistics using MoodScoringEngine.
@@ -82,19 +135,11 @@ class MoodAnalyzer:
                 "total_tracks": len(self.tracks)
             }
 
-        signals = []
-        tempos = []
-        for t in self.tracks_with_features:
-            signals.extend(audio_features_to_signals(t.audio_features))
-            tempos.append(t.audio_features.tempo)
-
-        engine = MoodScoringEngine(signals)
+        engine = MoodScoringEngine.from_arrays(self._energy, self._valence)
         avg_energy, avg_valence = engine.get_avg_energy_valence()
-        avg_tempo = statistics.mean(tempos)
+        avg_tempo = float(self._tempo.mean())
         mood, emoji, _, _ = engine.calculate_mood()
-
-        energies = [s.value for s in signals if s.name == "energy"]
-        valences = [s.value for s in signals if s.name == "valence"]
+        multiple = self._energy.size > 1
 
         return {
             "total_tracks": len(self.tracks),
@@ -104,67 +149,73 @@ class MoodAnalyzer:
             "avg_tempo": round(avg_tempo, 1),
             "mood_label": mood,
             "emoji": emoji,
-            "energy_std": round(statistics.stdev(energies), 3) if len(energies) > 1 else 0,
-            "valence_std": round(statistics.stdev(valences), 3) if len(valences) > 1 else 0
+            "energy_std": round(float(self._energy.std(ddof=1)), 3) if multiple else 0,
+            "valence_std": round(float(self._valence.std(ddof=1)), 3) if multiple else 0
         }
     
+    @_memoized
     def get_mood_by_hour(self) -> Dict[int, Dict]:
         """
-        Group mood statistics by hour of day using MoodScoringEngine.
+        Group mood statistics by hour of day.
         
         Returns:
             Dictionary mapping hour (0-23) to mood stats
         """
-        hour_tracks = defaultdict(list)
-        for track in self.tracks_with_features:
-            hour = track.timestamp.hour
-            hour_tracks[hour].append(track)
-
-        hour_moods = {}
-        for hour, tracks in hour_tracks.items():
-            signals = []
-            for t in tracks:
-                signals.extend(audio_features_to_signals(t.audio_features))
-            engine = MoodScoringEngine(signals)
-            avg_energy, avg_valence = engine.get_avg_energy_valence()
-            mood, emoji, _, _ = engine.calculate_mood()
-            hour_moods[hour] = {
-                "count": len(tracks),
-                "avg_energy": round(avg_energy, 3),
-                "avg_valence": round(avg_valence, 3),
-                "mood": mood,
-                "emoji": emoji
-            }
-        return dict(sorted(hour_moods.items()))
+        return {
+            int(hour): stats
+            for hour, stats in zip(*self._group_moods(self._hours, 24))
+        }
     
+    @_memoized
     def get_mood_by_day(self) -> Dict[str, Dict]:
         """
-        Group mood statistics by day using MoodScoringEngine.
+        Group mood statistics by day.
         
         Returns:
             Dictionary mapping date string to mood stats
         """
-        day_tracks = defaultdict(list)
-        for track in self.tracks_with_features:
-            day = track.timestamp.strftime("%Y-%m-%d")
-            day_tracks[day].append(track)
-
-        day_moods = {}
-        for day, tracks in day_tracks.items():
-            signals = []
-            for t in tracks:
-                signals.extend(audio_features_to_signals(t.audio_features))
-            engine = MoodScoringEngine(signals)
-            avg_energy, avg_valence = engine.get_avg_energy_valence()
-            mood, emoji, _, _ = engine.calculate_mood()
-            day_moods[day] = {
-                "count": len(tracks),
+        epoch_date = _EPOCH.date()
+        
+        return {
+            (epoch_date + timedelta(days=int(self._days[code]))).isoformat(): stats
+            for code, stats in zip(*self._group_moods(self._day_codes, self._days.size))
+        }
+    
+    def _group_moods(self, codes: np.ndarray, n_groups: int) -> Tuple[np.ndarray, List[Dict]]:
+        """
+        Mood stats per group in one bincount pass over the feature columns.
+        
+        Args:
+            codes: Group code (0..n_groups-1) per track with features
+            n_groups: Number of possible groups
+            
+        Returns:
+            Codes of the non-empty groups (ascending) and their mood stats
+        """
+        counts = np.bincount(codes, minlength=n_groups)
+        energy_sums = np.bincount(codes, weights=self._energy, minlength=n_groups)
+        valence_sums = np.bincount(codes, weights=self._valence, minlength=n_groups)
+        
+        present = np.flatnonzero(counts)
+        avg_energies = energy_sums[present] / counts[present]
+        avg_valences = valence_sums[present] / counts[present]
+        moods = calculate_mood_score_batch(avg_energies, avg_valences)
+        emojis = get_vibe_emoji_batch(avg_energies, avg_valences)
+        
+        group_stats = [
+            {
+                "count": count,
                 "avg_energy": round(avg_energy, 3),
                 "avg_valence": round(avg_valence, 3),
                 "mood": mood,
                 "emoji": emoji
             }
-        return dict(sorted(day_moods.items()))
+            for count, avg_energy, avg_valence, mood, emoji in zip(
+                counts[present].tolist(), avg_energies.tolist(), avg_valences.tolist(),
+                moods.tolist(), emojis.tolist()
+            )
+        ]
+        return present, group_stats
     
     def detect_mood_shifts(self, window_size: int = 5) -> List[Dict]:
         """
@@ -181,16 +232,31 @@ class MoodAnalyzer:
         
         shifts = []
         
-        for i in range(window_size, len(self.tracks_with_features) - window_size):
-            # Compare previous window to next window
-            before = self.tracks_with_features[i - window_size:i]
-            after = self.tracks_with_features[i:i + window_size]
-            
-            before_energy = statistics.mean([t.audio_features.energy for t in before])
-            after_energy = statistics.mean([t.audio_features.energy for t in after])
+        # Every window mean at once: window j covers tracks j..j+window_size-1
+        energy_means = self._window_means(self._energy, window_size)
+        valence_means = self._window_means(self._valence, window_size)
+        
+        # Compare previous window (ending before i) to next window (from i)
+        # for every i in [window_size, n - window_size)
+        n_windows = len(self.tracks_with_features) - 2 * window_size
+        energy_deltas = energy_means[window_size:window_size + n_windows] - energy_means[:n_windows]
+        valence_deltas = valence_means[window_size:window_size + n_windows] - valence_means[:n_windows]
+        
+        # Float window sums can be off by an ulp from statistics.mean, so they
+        # only pick candidates; those within _SHIFT_MARGIN of the threshold or
+        # past it are re-evaluated exactly, keeping boundary decisions stable
+        threshold = 0.3 - self._SHIFT_MARGIN
+        candidates = np.flatnonzero(
+            (np.abs(energy_deltas) > threshold) | (np.abs(valence_deltas) > threshold)
+        )
+        
+        for j in candidates.tolist():
+            i = j + window_size
+            before_energy = statistics.mean(self._energy[j:i].tolist())
+            after_energy = statistics.mean(self._energy[i:i + window_size].tolist())
             
-            before_valence = statistics.mean([t.audio_features.valence for t in before])
-            after_valence = statistics.mean([t.audio_features.valence for t in after])
+            before_valence = statistics.mean(self._valence[j:i].tolist())
+            after_valence = statistics.mean(self._valence[i:i + window_size].tolist())
             
             energy_delta = after_energy - before_energy
             valence_delta = after_valence - before_valence
@@ -199,14 +265,11 @@ class MoodAnalyzer:
             if abs(energy_delta) > 0.3 or abs(valence_delta) > 0.3:
                 track = self.tracks_with_features[i]
                 
-                before_mood = calculate_mood_score(before_energy, before_valence)
-                after_mood = calculate_mood_score(after_energy, after_valence)
-                
                 shifts.append({
                     "timestamp": track.timestamp.isoformat(),
                     "track": f"{track.song_name} by {track.artist}",
-                    "before_mood": before_mood,
-                    "after_mood": after_mood,
+                    "before_mood": calculate_mood_score(before_energy, before_valence),
+                    "after_mood": calculate_mood_score(after_energy, after_valence),
                     "energy_delta": round(energy_delta, 3),
                     "valence_delta": round(valence_delta, 3),
                     "shift_type": self._classify_shift(energy_delta, valence_delta)
@@ -214,6 +277,16 @@ class MoodAnalyzer:
         
         return shifts
     
+    # Slack between float window-sum deltas and the exact 0.3 threshold test
+    _SHIFT_MARGIN = 1e-9
+    
+    @staticmethod
+    def _window_means(values: np.ndarray, window_size: int) -> np.ndarray:
+        """Mean of every contiguous window of window_size values."""
+        # Each window is summed on its own, so error doesn't build up with
+        # history length the way differences of a running cumsum do
+        return sliding_window_view(values, window_size).sum(axis=1) / window_size
+    
     def _classify_shift(self, energy_delta: float, valence_delta: float) -> str:
         """Classify the type of mood shift."""
         if energy_delta > 0.3 and valence_delta > 0.3:
@@ -229,6 +302,7 @@ class MoodAnalyzer:
         else:
             return "Mood Shift"
     
+    @_memoized
     def get_mood_extremes(self) -> Dict:
         """
         Find the most extreme mood tracks.
@@ -239,17 +313,15 @@ class MoodAnalyzer:
         if not self.tracks_with_features:
             return {}
         
-        # Sort by energy
-        by_energy = sorted(
-            self.tracks_with_features,
-            key=lambda t: t.audio_features.energy
-        )
+        tracks = self.tracks_with_features
         
-        # Sort by valence
-        by_valence = sorted(
-            self.tracks_with_features,
-            key=lambda t: t.audio_features.valence
-        )
+        # Lowest = first minimum, highest = last maximum (what a stable
+        # ascending sort would put at either end)
+        def lowest(values: np.ndarray) -> Track:
+            return tracks[int(np.argmin(values))]
+        
+        def highest(values: np.ndarray) -> Track:
+            return tracks[values.size - 1 - int(np.argmax(values[::-1]))]
         
         def track_dict(track: Track) -> Dict:
             return {
@@ -261,47 +333,72 @@ class MoodAnalyzer:
             }
         
         return {
-            "highest_energy": track_dict(by_energy[-1]),
-            "lowest_energy": track_dict(by_energy[0]),
-            "happiest": track_dict(by_valence[-1]),
-            "saddest": track_dict(by_valence[0])
+            "highest_energy": track_dict(highest(self._energy)),
+            "lowest_energy": track_dict(lowest(self._energy)),
+            "happiest": track_dict(highest(self._valence)),
+            "saddest": track_dict(lowest(self._valence))
         }
 
 
-def load_tracks_from_json(filepath: str) -> List[Track]:
+def resolve_history_path(filepath: str) -> str:
     """
-    Load tracks from enriched_history.json.
+    Fall back to the legacy JSON history when a JSON lines file is missing.
+    
+    Histories written before the collector switched to JSON lines live in
+    enriched_history.json and are only migrated by the enriching collector.
     
     Args:
-        filepath: Path to JSON file
+        filepath: Path to JSON lines (or legacy JSON) file
         
     Returns:
-        List of Track objects
+        `filepath`, or the matching .json path if `filepath` is a missing
+        .jsonl file and the legacy file exists
     """
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    if filepath.endswith(".jsonl") and not os.path.exists(filepath):
+        legacy_path = filepath[:-len(".jsonl")] + ".json"
+        if os.path.exists(legacy_path):
+            return legacy_path
+    return filepath
+
+
+def load_tracks_from_json(filepath: str) -> TrackTable:
+    """
+    Load tracks from enriched_history.jsonl.
     
-    tracks = []
-    for item in data:
-        # Parse timestamp
-        timestamp = datetime.fromisoformat(item["timestamp"])
-        
-        # Create Track object
-        track = Track(
-            timestamp=timestamp,
-            track_id=item["track_id"],
-            song_name=item["song_name"],
-            artist=item["artist"],
-            album=item["album"],
-            duration_ms=item["duration_ms"],
-            duration_formatted=item["duration_formatted"]
-        )
+    Files ending in .jsonl are read one record per line; anything else is
+    parsed as a legacy single JSON array. A missing .jsonl file falls back
+    to the legacy .json file next to it.
+    
+    Args:
+        filepath: Path to JSON lines (or legacy JSON) file
         
-        # Add audio features if present
-        if item.get("audio_features"):
-            from core.models import AudioFeatures
-            track.audio_features = AudioFeatures(**item["audio_features"])
+    Returns:
+        TrackTable of the tracks sorted by timestamp (usable as a list of
+        Track objects, and shareable across analyzers)
+    """
+    filepath = resolve_history_path(filepath)
+    tracks = []
+    with open(filepath, "r", encoding="utf-8") as f:
+        # JSON lines are parsed as they are read; a legacy array is loaded whole
+        if filepath.endswith(".jsonl"):
+            records = (json.loads(line) for line in f if line.strip())
+        else:
+            records = json.load(f)
         
-        tracks.append(track)
+        for item in records:
+            # Records were validated when the collector wrote them, so
+            # models are constructed without re-running validation
+            features = item.get("audio_features")
+            
+            tracks.append(Track.model_construct(
+                timestamp=datetime.fromisoformat(item["timestamp"]),
+                track_id=item["track_id"],
+                song_name=item["song_name"],
+                artist=item["artist"],
+                album=item["album"],
+                duration_ms=item["duration_ms"],
+                duration_formatted=item["duration_formatted"],
+                audio_features=AudioFeatures.model_construct(**features) if features else None
+            ))
     
-    return tracks
+    return TrackTable.from_tracks(tracks)
@@ -4,9 +4,12 @@ Core data collection and enrichment modules for Spotify Behavioral Engine.
 from .models import Track, AudioFeatures, SkipEvent
 from .features import (
     AudioFeaturesEnricher,
+    FeatureCache,
     fetch_audio_features_safe,
     calculate_mood_score,
-    get_vibe_emoji
+    calculate_mood_score_batch,
+    get_vibe_emoji,
+    get_vibe_emoji_batch
 )
 from .collector import SpotifyCollector
 
@@ -17,9 +20,12 @@ __all__ = [
     "SkipEvent",
     # Features
     "AudioFeaturesEnricher",
+    "FeatureCache",
     "fetch_audio_features_safe",
     "calculate_mood_score",
+    "calculate_mood_score_batch",
     "get_vibe_emoji",
+    "get_vibe_emoji_batch",
     # Collector
     "SpotifyCollector",
 ]
\ No newline at end of file
@@ -17,7 +17,7 @@ import os
 import csv
 import json
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, TextIO, Tuple
 import psutil
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
@@ -27,6 +27,35 @@ from .models import Track, AudioFeatures
 from .features import AudioFeaturesEnricher, calculate_mood_score, get_vibe_emoji
 
 
+# Field order of the JSON lines records (matches Track / AudioFeatures)
+_TRACK_FIELDS = (
+    "track_id", "song_name", "artist", "album", "duration_ms",
+    "duration_formatted", "context_type", "context_uri", "shuffle_state",
+    "repeat_state",
+)
+_AUDIO_FEATURE_FIELDS = tuple(AudioFeatures.model_fields)
+
+
+def _track_record(track: Track) -> Dict[str, Any]:
+    """
+    Serialize a Track to a JSON-ready dict without Pydantic's dispatch.
+    
+    Produces the same record as track.model_dump(mode="json") for the
+    naive timestamps the collector logs.
+    """
+    record: Dict[str, Any] = {"timestamp": track.timestamp.isoformat()}
+    for field in _TRACK_FIELDS:
+        record[field] = getattr(track, field)
+    
+    features = track.audio_features
+    record["audio_features"] = (
+        None if features is None
+        else {field: getattr(features, field) for field in _AUDIO_FEATURE_FIELDS}
+    )
+    record["session_id"] = track.session_id
+    return record
+
+
 class SpotifyCollector:
     """
     Enhanced Spotify playback collector with mood tracking.
@@ -63,7 +92,9 @@ class SpotifyCollector:
         self.current_song_file = os.path.join(output_dir, "current_song.txt")
         self.history_txt_file = os.path.join(output_dir, "song_history.txt")
         self.history_csv_file = os.path.join(output_dir, "song_history.csv")
-        self.enriched_json_file = os.path.join(output_dir, "enriched_history.json")
+        self.enriched_json_file = os.path.join(output_dir, "enriched_history.jsonl")
+        self.legacy_json_file = os.path.join(output_dir, "enriched_history.json")
+        self.features_cache_file = os.path.join(output_dir, "features_cache.db")
         
         # Spotify API credentials
         self.client_id = os.getenv("SPOTIFY_CLIENT_ID")
@@ -75,6 +106,12 @@ class SpotifyCollector:
         if not self.client_id or not self.client_secret:
             raise ValueError("SPOTIFY_CLIENT_ID and SPOTIFY_CLIENT_SECRET must be set in .env")
         
+        # Carry over history from the old single-array JSON file, once
+        if enrich_features:
+            migrated = migrate_json_history(self.legacy_json_file, self.enriched_json_file)
+            if migrated and verbose:
+                print(f"📦 Migrated {migrated} tracks to {self.enriched_json_file}")
+        
         # Initialize Spotify client (lazy - only when needed)
         self._sp: Optional[spotipy.Spotify] = None
         self._enricher: Optional[AudioFeaturesEnricher] = None
@@ -83,6 +120,15 @@ class SpotifyCollector:
         self.last_track_id: Optional[str] = None
         self.last_played_at: Optional[datetime] = None
         self.current_session_id: Optional[str] = None
+        
+        # Cached Spotify process check: (monotonic time checked, result)
+        self.process_check_interval: float = 5.0
+        self._spotify_running: Optional[Tuple[float, bool]] = None
+        
+        # Append-only outputs stay open between tracks (opened on first write)
+        self._history_txt: Optional[TextIO] = None
+        self._csv_fh: Optional[TextIO] = None
+        self._csv_writer = None
     
     @property
     def sp(self) -> spotipy.Spotify:
@@ -95,7 +141,9 @@ class SpotifyCollector:
     def enricher(self) -> AudioFeaturesEnricher:
         """Lazy-initialize features enricher."""
         if self._enricher is None:
-            self._enricher = AudioFeaturesEnricher(self.sp, cache_features=True)
+            self._enricher = AudioFeaturesEnricher(
+                self.sp, cache_features=True, cache_path=self.features_cache_file
+            )
         return self._enricher
     
     def _get_spotify_client(self) -> spotipy.Spotify:
@@ -114,8 +162,25 @@ class SpotifyCollector:
         return spotipy.Spotify(auth_manager=auth_manager)
     
     def spotify_is_running(self) -> bool:
-        """Check if Spotify is currently running."""
-        return any("Spotify.exe" in p.name() for p in psutil.process_iter())
+        """
+        Check if Spotify is currently running.
+        
+        Scanning the process table is expensive, so the result is reused
+        for process_check_interval seconds.
+        """
+        now = time.monotonic()
+        if self._spotify_running is not None:
+            checked_at, running = self._spotify_running
+            if now - checked_at < self.process_check_interval:
+                return running
+        
+        # Only the name attribute is fetched for each process
+        running = any(
+            "Spotify.exe" in (p.info["name"] or "")
+            for p in psutil.process_iter(attrs=["name"])
+        )
+        self._spotify_running = (now, running)
+        return running
     
     def collect_playback(self) -> Optional[Track]:
         """
@@ -207,9 +272,11 @@ class SpotifyCollector:
                 f.write(f"  Vibe: {emoji} {mood}\n")
         
         # 2. Append to text history
-        with open(self.history_txt_file, "a", encoding="utf-8") as f:
-            timestamp_str = track.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            f.write(f"[{timestamp_str}] Song: {track.song_name} | Artist: {track.artist} | Duration: {track.duration_formatted}\n")
+        if self._history_txt is None:
+            self._history_txt = open(self.history_txt_file, "a", encoding="utf-8")
+        timestamp_str = track.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        self._history_txt.write(f"[{timestamp_str}] Song: {track.song_name} | Artist: {track.artist} | Duration: {track.duration_formatted}\n")
+        self._history_txt.flush()
         
         # 3. Append to CSV (legacy format for compatibility)
         self._save_to_csv(track)
@@ -223,47 +290,49 @@ class SpotifyCollector:
     
     def _save_to_csv(self, track: Track):
         """Save track to CSV in legacy format."""
-        file_exists = os.path.exists(self.history_csv_file)
-        
-        with open(self.history_csv_file, "a", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
+        if self._csv_writer is None:
+            file_exists = os.path.exists(self.history_csv_file)
+            self._csv_fh = open(self.history_csv_file, "a", newline="", encoding="utf-8")
+            self._csv_writer = csv.writer(self._csv_fh)
             
             # Write header if new file
             if not file_exists:
-                writer.writerow([
+                self._csv_writer.writerow([
                     "timestamp", "song_name", "artist", "album", 
                     "track_id", "duration_ms", "duration_formatted"
                 ])
-            
-            # Write track data
-            timestamp_str = track.timestamp.strftime("%Y-%m-%d %H:%M:%S")
-            writer.writerow([
-                timestamp_str,
-                track.song_name,
-                track.artist,
-                track.album,
-                track.track_id,
-                track.duration_ms,
-                track.duration_formatted
-            ])
+        
+        # Write track data
+        timestamp_str = track.timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        self._csv_writer.writerow([
+            timestamp_str,
+            track.song_name,
+            track.artist,
+            track.album,
+            track.track_id,
+            track.duration_ms,
+            track.duration_formatted
+        ])
+        self._csv_fh.flush()
     
     def _save_to_json(self, track: Track):
-        """Save track to JSON lines format with full enrichment."""
-        # Load existing data
-        tracks = []
-        if os.path.exists(self.enriched_json_file):
-            with open(self.enriched_json_file, "r", encoding="utf-8") as f:
-                try:
-                    tracks = json.load(f)
-                except json.JSONDecodeError:
-                    tracks = []
-        
-        # Append new track
-        tracks.append(track.model_dump(mode='json'))
-        
-        # Save updated data
-        with open(self.enriched_json_file, "w", encoding="utf-8") as f:
-            json.dump(tracks, f, indent=2, ensure_ascii=False, default=str)
+        """Append track to the JSON lines history with full enrichment."""
+        # One record per line: appending never re-reads existing history
+        with open(self.enriched_json_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(_track_record(track), ensure_ascii=False, default=str) + "\n")
+    
+    def close(self):
+        """Close the history files kept open between writes."""
+        if self._history_txt is not None:
+            self._history_txt.close()
+            self._history_txt = None
+        if self._csv_fh is not None:
+            self._csv_fh.close()
+            self._csv_fh = None
+            self._csv_writer = None
+        if self._enricher is not None:
+            self._enricher.close()
+            self._enricher = None
     
     def _format_duration(self, duration_ms: int) -> str:
         """Convert milliseconds to M:SS format."""
@@ -297,9 +366,18 @@ class SpotifyCollector:
         
         print("🎧 Monitoring playback... (Press Ctrl+C to stop)\n")
         
+        # One process scan per poll: collect_playback reuses the loop's check.
+        # Half a poll interval, so the next poll (about poll_interval later,
+        # give or take clock resolution) never reuses the previous result.
+        self.process_check_interval = poll_interval * 0.5
+        
         # Main loop
         try:
             while True:
+                # Polls are scheduled on a fixed cadence: time spent on API
+                # round-trips comes out of the sleep instead of adding to it
+                next_poll = time.monotonic() + poll_interval
+                
                 if self.spotify_is_running():
                     track = self.collect_playback()
                     if track:
@@ -309,13 +387,53 @@ class SpotifyCollector:
                         print("⏸️  Spotify closed. Waiting...")
                     self.last_track_id = None
                 
-                time.sleep(poll_interval)
+                time.sleep(max(0.0, next_poll - time.monotonic()))
                 
         except KeyboardInterrupt:
             print("\n\n👋 Stopping collector. Stats:")
-            if self.enricher:
-                print(f"   Cached features: {self.enricher.cache_size()}")
+            # Checked without the lazy property, which would create the enricher
+            if self._enricher is not None:
+                print(f"   Cached features: {self._enricher.cache_size()}")
             print("   Goodbye!")
+        
+        finally:
+            # Release history files and the feature cache however the loop ends
+            self.close()
+
+
+def migrate_json_history(json_path: str, jsonl_path: str) -> int:
+    """
+    Convert a legacy single-array JSON history to JSON lines.
+    
+    Does nothing if the JSON lines file already exists or there is no
+    legacy file; the legacy file is left in place.
+    
+    Args:
+        json_path: Path to the legacy enriched_history.json
+        jsonl_path: Path of the JSON lines file to create
+        
+    Returns:
+        Number of records migrated
+    """
+    if os.path.exists(jsonl_path) or not os.path.exists(json_path):
+        return 0
+    
+    with open(json_path, "r", encoding="utf-8") as f:
+        try:
+            records = json.load(f)
+        except json.JSONDecodeError:
+            records = []
+    
+    # Written under a temporary name and moved into place once complete, so
+    # an interrupted migration never leaves a partial history that blocks
+    # the next attempt
+    tmp_path = jsonl_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+    os.replace(tmp_path, jsonl_path)
+    
+    return len(records)
 
 
 def main():
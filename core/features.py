@@ -10,8 +10,15 @@ handles such errors gracefully by returning fallback structures.
 """
 
 import time
+import random
 import logging
-from typing import List, Optional, Dict, Any
+import sqlite3
+import struct
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Iterable, Tuple, Union
+
+import numpy as np
 from spotipy import Spotify
 from spotipy.exceptions import SpotifyException
 from .models import AudioFeatures
@@ -32,7 +39,7 @@ def fetch_audio_features_safe(
     Spotify's audio-features endpoint may be deprecated or restricted for
     development apps, often returning HTTP 403 Forbidden. This function:
     - Catches 403 errors specifically and returns fallback structure
-    - Retries only on 429 (rate limit) errors with exponential backoff
+    - Retries only on 429 (rate limit) errors with jittered exponential backoff
     - Logs errors without crashing the application
     - Returns None or fallback dict on permanent failures
     
@@ -94,8 +101,9 @@ def fetch_audio_features_safe(
                         "track_id": track_id
                     }
                 
-                # Exponential backoff
-                wait_time = retry_delay * (2 ** (retry_count - 1))
+                # Exponential backoff, jittered so concurrent callers don't
+                # retry in lockstep
+                wait_time = retry_delay * (2 ** (retry_count - 1)) + random.uniform(0, retry_delay / 4)
                 retry_after = e.headers.get('Retry-After', wait_time)
                 sleep_time = float(retry_after) if isinstance(retry_after, (int, float, str)) else wait_time
                 
@@ -122,6 +130,106 @@ def fetch_audio_features_safe(
     return {"source": "unavailable", "reason": "unknown", "track_id": track_id}
 
 
+class FeatureCache:
+    """
+    Audio features cache persisted to a SQLite file.
+    
+    Keeps fetched features across runs, so repeat enrichment of known
+    tracks needs no API calls. Each row is the track's numeric features
+    packed into a fixed-size blob. Rows are also held in memory after
+    their first use.
+    
+    Supports the dict operations the enricher uses: `in`, [], []=,
+    update(), clear() and len().
+    """
+    
+    _FLOAT_FIELDS = (
+        "energy", "valence", "danceability", "acousticness", "instrumentalness",
+        "speechiness", "liveness", "loudness", "tempo",
+    )
+    _INT_FIELDS = ("key", "mode", "time_signature", "duration_ms")
+    _ROW = struct.Struct("<9d4q")
+    
+    def __init__(self, path: str):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            path: SQLite database file
+        """
+        self.path = path
+        self._memory: Dict[str, AudioFeatures] = {}
+        # Callers serialize access; the enricher may be shared across threads
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS features (track_id TEXT PRIMARY KEY, row BLOB NOT NULL)"
+        )
+        self._db.commit()
+    
+    def _pack(self, features: AudioFeatures) -> bytes:
+        return self._ROW.pack(
+            *(getattr(features, f) for f in self._FLOAT_FIELDS),
+            *(getattr(features, f) for f in self._INT_FIELDS)
+        )
+    
+    def _unpack(self, track_id: str, row: bytes) -> AudioFeatures:
+        # Rows were validated before they were stored
+        values = self._ROW.unpack(row)
+        return AudioFeatures.model_construct(
+            track_id=track_id,
+            **dict(zip(self._FLOAT_FIELDS + self._INT_FIELDS, values))
+        )
+    
+    def get(self, track_id: str) -> Optional[AudioFeatures]:
+        """Cached features for a track, or None."""
+        features = self._memory.get(track_id)
+        if features is None:
+            found = self._db.execute(
+                "SELECT row FROM features WHERE track_id = ?", (track_id,)
+            ).fetchone()
+            if found is None:
+                return None
+            features = self._memory[track_id] = self._unpack(track_id, found[0])
+        return features
+    
+    def __contains__(self, track_id: str) -> bool:
+        return self.get(track_id) is not None
+    
+    def __getitem__(self, track_id: str) -> AudioFeatures:
+        features = self.get(track_id)
+        if features is None:
+            raise KeyError(track_id)
+        return features
+    
+    def __setitem__(self, track_id: str, features: AudioFeatures):
+        self.update({track_id: features})
+    
+    def update(self, items: Union[Dict[str, AudioFeatures], Iterable[Tuple[str, AudioFeatures]]]):
+        """Store several entries in one transaction."""
+        items = dict(items)
+        self._memory.update(items)
+        self._db.executemany(
+            "INSERT OR REPLACE INTO features (track_id, row) VALUES (?, ?)",
+            [(track_id, self._pack(f)) for track_id, f in items.items()]
+        )
+        self._db.commit()
+    
+    def clear(self):
+        """Remove every cached entry, in memory and on disk."""
+        self._memory.clear()
+        self._db.execute("DELETE FROM features")
+        self._db.commit()
+    
+    def __len__(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM features").fetchone()[0]
+    
+    def close(self):
+        """Close the database connection."""
+        self._db.close()
+
+
 class AudioFeaturesEnricher:
     """
     Fetches and caches audio features from Spotify API.
@@ -137,17 +245,35 @@ class AudioFeaturesEnricher:
         batch_features = enricher.get_features_batch(["id1", "id2", ...])
     """
     
-    def __init__(self, spotify_client: Spotify, cache_features: bool = True):
+    def __init__(
+        self,
+        spotify_client: Spotify,
+        cache_features: bool = True,
+        cache_path: Optional[str] = None
+    ):
         """
         Initialize the enricher.
         
         Args:
             spotify_client: Authenticated Spotipy client
             cache_features: Whether to cache features in memory (reduces API calls)
+            cache_path: SQLite file to persist the cache across runs
+                (in-memory only if None)
         """
         self.sp = spotify_client
         self.cache_features = cache_features
-        self._cache: Dict[str, AudioFeatures] = {}
+        self._cache: Union[Dict[str, AudioFeatures], FeatureCache] = (
+            FeatureCache(cache_path) if cache_features and cache_path else {}
+        )
+        
+        # Fetches in progress, so concurrent requests for one track share a call
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        
+        # Tracks Spotify refused or had no data for: id -> (monotonic time, reason).
+        # They are not requested again until unavailable_ttl seconds pass.
+        self.unavailable_ttl: float = 3600.0
+        self._unavailable: Dict[str, Tuple[float, str]] = {}
     
     def get_features(self, track_id: str, retry_on_failure: bool = True) -> Optional[AudioFeatures]:
         """
@@ -155,6 +281,8 @@ class AudioFeaturesEnricher:
         
         Uses fetch_audio_features_safe() to handle 403/429 errors gracefully.
         Returns None if features are unavailable (403, errors, etc.)
+        Concurrent calls for the same track wait on a single API request, and
+        tracks recently found unavailable are not requested again.
         
         Args:
             track_id: Spotify track ID
@@ -163,10 +291,38 @@ class AudioFeaturesEnricher:
         Returns:
             AudioFeatures object or None if fetch fails or endpoint is unavailable
         """
-        # Check cache first
-        if self.cache_features and track_id in self._cache:
-            return self._cache[track_id]
+        with self._lock:
+            # Check cache first
+            if self.cache_features and track_id in self._cache:
+                return self._cache[track_id]
+            if self._is_unavailable(track_id):
+                return None
+            
+            # Join a fetch another caller already has in flight for this track
+            pending = self._inflight.get(track_id)
+            if pending is None:
+                pending = self._inflight[track_id] = Future()
+                is_owner = True
+            else:
+                is_owner = False
+        
+        if not is_owner:
+            return pending.result()
         
+        try:
+            features = self._fetch_features(track_id, retry_on_failure)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(features)
+            return features
+        finally:
+            with self._lock:
+                del self._inflight[track_id]
+    
+    def _fetch_features(self, track_id: str, retry_on_failure: bool) -> Optional[AudioFeatures]:
+        """Fetch, parse and cache features for one track (no cache lookup)."""
         # Use safe fetcher with proper error handling
         max_retries = 3 if retry_on_failure else 0
         raw_features = fetch_audio_features_safe(self.sp, track_id, max_retries=max_retries)
@@ -183,6 +339,8 @@ class AudioFeaturesEnricher:
                 logger.info(f"Audio features unavailable for {track_id} (403 - deprecated/restricted)")
             else:
                 logger.warning(f"Audio features unavailable for {track_id}: {reason}")
+            if reason in self._PERSISTENT_FAILURES:
+                self._mark_unavailable([track_id], reason)
             return None
         
         try:
@@ -191,7 +349,8 @@ class AudioFeaturesEnricher:
             
             # Cache result
             if self.cache_features:
-                self._cache[track_id] = features
+                with self._lock:
+                    self._cache[track_id] = features
             
             return features
         
@@ -199,87 +358,169 @@ class AudioFeaturesEnricher:
             logger.error(f"Failed to parse audio features for {track_id}: {e}")
             return None
     
-    def get_features_batch(self, track_ids: List[str], batch_size: int = 50) -> Dict[str, AudioFeatures]:
+    # Failure reasons that won't change on an immediate retry
+    _PERSISTENT_FAILURES = ("403_deprecated", "no_data")
+    
+    def _is_unavailable(self, track_id: str) -> bool:
+        """Whether a track was recently found unavailable (call with the lock held)."""
+        entry = self._unavailable.get(track_id)
+        if entry is None:
+            return False
+        if time.monotonic() - entry[0] < self.unavailable_ttl:
+            return True
+        del self._unavailable[track_id]
+        return False
+    
+    def _mark_unavailable(self, track_ids: List[str], reason: str):
+        """Remember tracks Spotify has no features for, for unavailable_ttl seconds."""
+        now = time.monotonic()
+        with self._lock:
+            for track_id in track_ids:
+                self._unavailable[track_id] = (now, reason)
+    
+    def get_features_batch(
+        self,
+        track_ids: List[str],
+        batch_size: int = 100,
+        max_workers: int = 4
+    ) -> Dict[str, AudioFeatures]:
         """
         Fetch audio features for multiple tracks efficiently with safe error handling.
         
-        Spotify API allows up to 100 tracks per request, but we use 50 to be safe.
-        Falls back to individual fetches if batch fails with 403.
+        Requests carry up to 100 tracks each, the Spotify API maximum.
+        Up to max_workers batch requests are in flight at once, so network
+        round-trips overlap instead of running back to back. The first 403
+        cancels batches not yet sent, since they would be refused too;
+        responses to requests already sent are still used. Tracks refused
+        or missing from a response are skipped by later calls for
+        unavailable_ttl seconds. Tracks another call is already fetching
+        are waited on rather than requested again, and concurrent callers
+        wait on this call's batches the same way.
         
         Args:
             track_ids: List of Spotify track IDs
             batch_size: Number of tracks per API request (max 100)
+            max_workers: Maximum number of concurrent batch requests
             
         Returns:
             Dictionary mapping track_id -> AudioFeatures
         """
         results = {}
         uncached_ids = []
+        waiting: Dict[str, Future] = {}
         
-        # Check cache first
-        if self.cache_features:
-            for track_id in track_ids:
-                if track_id in self._cache:
+        # Check cache first; each uncached id is requested once. Tracks another
+        # caller is already fetching are waited on; the rest are registered as
+        # in flight so concurrent callers wait on this call instead.
+        with self._lock:
+            for track_id in dict.fromkeys(track_ids):
+                if self.cache_features and track_id in self._cache:
                     results[track_id] = self._cache[track_id]
+                elif self._is_unavailable(track_id):
+                    continue
+                elif track_id in self._inflight:
+                    waiting[track_id] = self._inflight[track_id]
                 else:
                     uncached_ids.append(track_id)
-        else:
-            uncached_ids = track_ids
+                    self._inflight[track_id] = Future()
+            owned = {track_id: self._inflight[track_id] for track_id in uncached_ids}
         
-        # Fetch uncached tracks in batches
-        for i in range(0, len(uncached_ids), batch_size):
-            batch = uncached_ids[i:i + batch_size]
-            
-            try:
-                # Fetch batch from API (risky - may get 403 for all)
-                raw_features_list = self.sp.audio_features(batch)
+        try:
+            # Fetch uncached tracks in batches; requests run concurrently (bounded
+            # by max_workers) and responses are parsed in batch order
+            starts = range(0, len(uncached_ids), batch_size)
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [
+                    pool.submit(self.sp.audio_features, uncached_ids[i:i + batch_size])
+                    for i in starts
+                ]
                 
-                # Parse each result
-                for j, raw_features in enumerate(raw_features_list):
-                    if raw_features is None:
-                        continue
-                    
-                    # Check for fallback structure
-                    if isinstance(raw_features, dict) and raw_features.get("source") == "unavailable":
+                for i, future in zip(starts, futures):
+                    # Never sent, after an earlier batch was refused
+                    if future.cancelled():
                         continue
                     
                     try:
-                        features = self._parse_features(raw_features)
-                        track_id = features.track_id
+                        # Batch response from API (risky - may get 403 for all)
+                        raw_features_list = future.result()
+                        fetched = {}
                         
-                        results[track_id] = features
+                        # Parse each result
+                        for j, raw_features in enumerate(raw_features_list):
+                            if raw_features is None:
+                                self._mark_unavailable([uncached_ids[i + j]], "no_data")
+                                continue
+                            
+                            # Check for fallback structure
+                            if isinstance(raw_features, dict) and raw_features.get("source") == "unavailable":
+                                continue
+                            
+                            try:
+                                features = self._parse_features(raw_features)
+                                track_id = features.track_id
+                                
+                                results[track_id] = features
+                                fetched[track_id] = features
+                            except Exception as parse_error:
+                                logger.warning(f"Failed to parse features for batch item {j}: {parse_error}")
+                                continue
                         
-                        # Cache
+                        # Cache the whole batch at once (one transaction when persisted)
                         if self.cache_features:
-                            self._cache[track_id] = features
-                    except Exception as parse_error:
-                        logger.warning(f"Failed to parse features for batch item {j}: {parse_error}")
-                        continue
-                
-                # Rate limiting - be nice to Spotify API
-                if i + batch_size < len(uncached_ids):
-                    time.sleep(0.5)
-            
-            except SpotifyException as e:
-                if e.http_status == 403:
-                    logger.warning(
-                        f"Batch fetch returned 403 (deprecated/restricted). "
-                        f"Consider using behavioral analysis instead of audio features."
-                    )
-                    # Don't try individual fetches - they'll all fail too
-                    break
-                elif e.http_status == 429:
-                    retry_after = float(e.headers.get('Retry-After', 2))
-                    logger.info(f"Rate limited (429). Waiting {retry_after}s before continuing...")
-                    time.sleep(retry_after)
-                    continue
-                else:
-                    logger.error(f"Spotify API error {e.http_status} for batch at index {i}: {e}")
-                    continue
+                            with self._lock:
+                                self._cache.update(fetched)
                     
+                    except SpotifyException as e:
+                        if e.http_status == 403:
+                            logger.warning(
+                                f"Batch fetch returned 403 (deprecated/restricted). "
+                                f"Consider using behavioral analysis instead of audio features."
+                            )
+                            self._mark_unavailable(uncached_ids[i:i + batch_size], "403_deprecated")
+                            
+                            # Don't send the queued batches - they'll all fail too.
+                            # Batches already sent may have succeeded, so they
+                            # are still read.
+                            for start, pending in zip(starts, futures):
+                                if pending.cancel():
+                                    self._mark_unavailable(
+                                        uncached_ids[start:start + batch_size], "403_deprecated"
+                                    )
+                            continue
+                        elif e.http_status == 429:
+                            # Spotipy's session already retried with Retry-After;
+                            # the other batches were sent already, so waiting here
+                            # would only delay reading their responses
+                            logger.info(
+                                f"Rate limited (429) for batch at index {i}; "
+                                f"its tracks will be requested again on the next call"
+                            )
+                            continue
+                        else:
+                            logger.error(f"Spotify API error {e.http_status} for batch at index {i}: {e}")
+                            continue
+                            
+                    except Exception as e:
+                        logger.error(f"Unexpected error fetching batch starting at index {i}: {e}")
+                        continue
+                        
+                    finally:
+                        # Hand this batch's results to callers waiting on it
+                        self._resolve_inflight(owned, uncached_ids[i:i + batch_size], results)
+        
+        finally:
+            # Release any tracks whose batch was never read
+            self._resolve_inflight(owned, list(owned), results)
+        
+        # Tracks another caller was already fetching
+        for track_id, pending in waiting.items():
+            try:
+                features = pending.result()
             except Exception as e:
-                logger.error(f"Unexpected error fetching batch starting at index {i}: {e}")
+                logger.warning(f"Shared fetch failed for track {track_id}: {e}")
                 continue
+            if features is not None:
+                results[track_id] = features
         
         # Report results
         success_rate = (len(results) / len(track_ids)) * 100 if track_ids else 0
@@ -290,6 +531,26 @@ class AudioFeaturesEnricher:
         
         return results
     
+    def _resolve_inflight(
+        self,
+        owned: Dict[str, Future],
+        track_ids: Iterable[str],
+        results: Dict[str, AudioFeatures]
+    ):
+        """
+        Finish a batch's in-flight fetches for the given tracks.
+        
+        Each future is removed from `owned` and `_inflight`, then resolved
+        with the track's features (None if none were fetched); tracks
+        already resolved are skipped.
+        """
+        resolved = [(track_id, owned.pop(track_id)) for track_id in track_ids if track_id in owned]
+        with self._lock:
+            for track_id, _ in resolved:
+                del self._inflight[track_id]
+        for track_id, pending in resolved:
+            pending.set_result(results.get(track_id))
+    
     def _parse_features(self, raw_features: Dict[str, Any]) -> AudioFeatures:
         """
         Convert Spotify API response to our AudioFeatures model.
@@ -325,6 +586,42 @@ class AudioFeaturesEnricher:
     def cache_size(self) -> int:
         """Return number of cached features."""
         return len(self._cache)
+    
+    def close(self):
+        """Close the persistent cache, if one is open."""
+        if isinstance(self._cache, FeatureCache):
+            self._cache.close()
+
+
+# Energy/valence are each split into three bands: low (< 0.4),
+# mid (0.4-0.6) and high (> 0.6). Labels are indexed [energy][valence].
+_LOW, _MID, _HIGH = 0, 1, 2
+
+_MOOD_LABELS = (
+    ("Melancholic & Low", "Reflective & Subdued", "Calm & Peaceful"),
+    ("Somber & Tense", "Balanced & Neutral", "Upbeat & Pleasant"),
+    ("Intense & Aggressive", "Energetic & Neutral", "Energetic & Happy"),
+)
+
+_VIBE_EMOJIS = (
+    ("🌧️😢", "🎵😐", "🌙😌"),  # Low energy
+    ("🎵😐", "🎵😐", "🎵😐"),    # Mid energy
+    ("⚡😤", "🎵😐", "🔥😄"),    # High energy
+)
+
+
+# Object arrays of the same tables, for fancy-indexing whole columns
+_MOOD_LABEL_ARRAY = np.array(_MOOD_LABELS, dtype=object)
+_VIBE_EMOJI_ARRAY = np.array(_VIBE_EMOJIS, dtype=object)
+
+
+def _band(value: float) -> int:
+    """Band index for an energy/valence value."""
+    if value > 0.6:
+        return _HIGH
+    if value < 0.4:
+        return _LOW
+    return _MID
 
 
 def calculate_mood_score(energy: float, valence: float) -> str:
@@ -344,27 +641,7 @@ def calculate_mood_score(energy: float, valence: float) -> str:
     Returns:
         Mood label string
     """
-    if energy > 0.6:
-        if valence > 0.6:
-            return "Energetic & Happy"
-        elif valence < 0.4:
-            return "Intense & Aggressive"
-        else:
-            return "Energetic & Neutral"
-    elif energy < 0.4:
-        if valence > 0.6:
-            return "Calm & Peaceful"
-        elif valence < 0.4:
-            return "Melancholic & Low"
-        else:
-            return "Reflective & Subdued"
-    else:
-        if valence > 0.6:
-            return "Upbeat & Pleasant"
-        elif valence < 0.4:
-            return "Somber & Tense"
-        else:
-            return "Balanced & Neutral"
+    return _MOOD_LABELS[_band(energy)][_band(valence)]
 
 
 def get_vibe_emoji(energy: float, valence: float) -> str:
@@ -378,13 +655,41 @@ def get_vibe_emoji(energy: float, valence: float) -> str:
     Returns:
         Emoji string
     """
-    if energy > 0.6 and valence > 0.6:
-        return "🔥😄"  # High energy, high valence
-    elif energy > 0.6 and valence < 0.4:
-        return "⚡😤"  # High energy, low valence
-    elif energy < 0.4 and valence > 0.6:
-        return "🌙😌"  # Low energy, high valence
-    elif energy < 0.4 and valence < 0.4:
-        return "🌧️😢"  # Low energy, low valence
-    else:
-        return "🎵😐"  # Neutral
+    return _VIBE_EMOJIS[_band(energy)][_band(valence)]
+
+
+def _band_array(values: np.ndarray) -> np.ndarray:
+    """Band index for every value of an energy/valence column."""
+    values = np.asarray(values, dtype=np.float64)
+    bands = np.full(values.shape, _MID, dtype=np.intp)
+    bands[values > 0.6] = _HIGH
+    bands[values < 0.4] = _LOW
+    return bands
+
+
+def calculate_mood_score_batch(energy: np.ndarray, valence: np.ndarray) -> np.ndarray:
+    """
+    Vectorized calculate_mood_score over energy/valence columns.
+    
+    Args:
+        energy: Energy levels (0.0-1.0)
+        valence: Musical positivity values (0.0-1.0)
+        
+    Returns:
+        Object array of mood label strings, one per input pair
+    """
+    return _MOOD_LABEL_ARRAY[_band_array(energy), _band_array(valence)]
+
+
+def get_vibe_emoji_batch(energy: np.ndarray, valence: np.ndarray) -> np.ndarray:
+    """
+    Vectorized get_vibe_emoji over energy/valence columns.
+    
+    Args:
+        energy: Energy levels (0.0-1.0)
+        valence: Musical positivity values (0.0-1.0)
+        
+    Returns:
+        Object array of emoji strings, one per input pair
+    """
+    return _VIBE_EMOJI_ARRAY[_band_array(energy), _band_array(valence)]
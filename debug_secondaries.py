@@ -4,17 +4,30 @@ with open('final_analysis.json') as f:
     data = json.load(f)
 
 print("SECONDARY BEHAVIOR ANALYSIS (final_analysis.json)\n")
+
+# Summary counters are updated in the same pass that prints each session
+total_sessions = 0
+with_secondary = 0
+min_score = max_score = None
+
 for a in data['analyses']:
     print(f"Session: {a['track_count']} tracks, {a['duration_minutes']:.0f}min")
     print(f"  Primary: {a['predicted_state']} ({a['predicted_confidence']:.0%})")
     print(f"  Secondary: {a['predicted_secondary']}")
     print()
 
+    total_sessions += 1
+    if a['predicted_secondary']:
+        with_secondary += 1
+    for _, score in a['predicted_secondary']:
+        min_score = score if min_score is None else min(min_score, score)
+        max_score = score if max_score is None else max(max_score, score)
+
 print("SUMMARY:")
-total_sessions = len(data['analyses'])
-with_secondary = sum(1 for a in data['analyses'] if a['predicted_secondary'])
 secondary_freq = with_secondary / total_sessions if total_sessions > 0 else 0
 print(f"  Sessions with ANY secondary: {with_secondary}/{total_sessions} ({secondary_freq:.0%})")
 print(f"  Current threshold in code: 0.15")
-print(f"  Secondary scores range: {[s[1] for a in data['analyses'] for s in a['predicted_secondary']]}")
-
+if min_score is None:
+    print("  Secondary scores range: none")
+else:
+    print(f"  Secondary scores range: {min_score}..{max_score}")
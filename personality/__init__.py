@@ -11,7 +11,7 @@ Usage:
     from personality import RoastEngine
     from analysis import BehaviorClassifier, load_tracks_from_json
     
-    tracks = load_tracks_from_json("enriched_history.json")
+    tracks = load_tracks_from_json("enriched_history.jsonl")
     behavior = BehaviorClassifier(tracks)
     events = behavior.detect_behavioral_events()
     
@@ -4,7 +4,7 @@ Personality narrator - Convert metrics into natural language insights.
 Transforms cold analytics into warm (or savage) commentary.
 """
 
-from typing import List, Dict
+from typing import Callable, List, Dict, Tuple
 from analysis.mood import MoodAnalyzer
 from analysis.habits import HabitsAnalyzer
 from .tone import Tone, ToneType, get_commentary, get_tone_emoji, get_tone_description
@@ -15,6 +15,9 @@ class Narrator:
     Natural language narrator for listening insights.
     
     Converts analytics into personality-driven commentary.
+    
+    Report sections are rendered once per tone and reused; the analyzers
+    are treated as fixed, so build a new Narrator for new data.
     """
     
     def __init__(self, mood_analyzer: MoodAnalyzer, habits_analyzer: HabitsAnalyzer, tone: ToneType = ToneType.FRIEND):
@@ -29,6 +32,9 @@ class Narrator:
         self.mood = mood_analyzer
         self.habits = habits_analyzer
         self.tone = tone
+        
+        # Rendered report sections: (section method name, tone) -> text
+        self._sections: Dict[Tuple[str, ToneType], str] = {}
     
     def set_tone(self, tone: ToneType):
         """Change narrator tone."""
@@ -51,14 +57,14 @@ class Narrator:
         lines.append("=" * 60)
         
         # Listening habits
-        lines.append(self._narrate_time_patterns())
-        lines.append(self._narrate_artist_behavior())
-        lines.append(self._narrate_repeat_behavior())
-        lines.append(self._narrate_streaks())
-        lines.append(self._narrate_sessions())
+        lines.append(self._section(self._narrate_time_patterns))
+        lines.append(self._section(self._narrate_artist_behavior))
+        lines.append(self._section(self._narrate_repeat_behavior))
+        lines.append(self._section(self._narrate_streaks))
+        lines.append(self._section(self._narrate_sessions))
         
         # Mood analysis (if available)
-        mood_section = self._narrate_mood()
+        mood_section = self._section(self._narrate_mood)
         if mood_section:
             lines.append(mood_section)
         
@@ -69,6 +75,13 @@ class Narrator:
         
         return "\n".join(lines)
     
+    def _section(self, narrate: Callable[[], str]) -> str:
+        """Render a report section for the current tone, reusing earlier renders."""
+        key = (narrate.__name__, self.tone)
+        if key not in self._sections:
+            self._sections[key] = narrate()
+        return self._sections[key]
+    
     def _narrate_time_patterns(self) -> str:
         """Generate commentary on listening time patterns."""
         lines = ["\n📅 WHEN YOU LISTEN"]
@@ -77,7 +90,7 @@ class Narrator:
         
         if "error" not in hours:
             peak_hour = hours['most_active_hour']
-            lines.append(get_commentary(Tone.PEAK_HOUR, self.tone, peak_hour))
+            lines.append(get_commentary(Tone.PEAK_HOUR, self.tone, hour=peak_hour))
             
             # Late night listener?
             if peak_hour >= 22 or peak_hour <= 2:
@@ -105,14 +118,14 @@ class Narrator:
             top = top_artists[0]
             lines.append(get_commentary(
                 Tone.TOP_ARTIST, self.tone,
-                top['artist'], top['percentage']
+                artist=top['artist'], pct=top['percentage']
             ))
             
             # Obsessed?
             if top['percentage'] > 15:
                 lines.append(get_commentary(
                     Tone.ARTIST_OBSESSED, self.tone,
-                    top['artist'], top['play_count']
+                    artist=top['artist'], count=top['play_count']
                 ))
         
         # Diversity
@@ -120,7 +133,7 @@ class Narrator:
         if repeats.get('diversity_score'):
             score = repeats['diversity_score']
             if score > 0.7:
-                lines.append(get_commentary(Tone.DIVERSE_TASTE, self.tone, score))
+                lines.append(get_commentary(Tone.DIVERSE_TASTE, self.tone, score=score))
         
         return "\n".join(lines)
     
@@ -133,12 +146,12 @@ class Narrator:
         repeat_pct = repeats.get('repeat_percentage', 0)
         
         if repeat_pct > 30:
-            lines.append(get_commentary(Tone.HIGH_REPEATER, self.tone, repeat_pct))
+            lines.append(get_commentary(Tone.HIGH_REPEATER, self.tone, pct=repeat_pct))
         elif repeat_pct < 10:
             lines.append(get_commentary(Tone.LOW_REPEATER, self.tone))
         else:
             # Default commentary for moderate repeat rates
-            lines.append(get_commentary(Tone.MODERATE_REPEATER, self.tone, repeat_pct))
+            lines.append(get_commentary(Tone.MODERATE_REPEATER, self.tone, pct=repeat_pct))
         
         # Most repeated song
         most_repeated = repeats.get('most_repeated', [])
@@ -147,7 +160,7 @@ class Narrator:
             if top_repeat['play_count'] >= 5:
                 lines.append(get_commentary(
                     Tone.SONG_ADDICTION, self.tone,
-                    top_repeat['song'], top_repeat['play_count']
+                    song=top_repeat['song'], count=top_repeat['play_count']
                 ))
         
         return "\n".join(lines)
@@ -163,12 +176,12 @@ class Narrator:
             longest = streaks.get('longest_streak', 0)
             
             if current >= 3:
-                lines.append(get_commentary(Tone.LONG_STREAK, self.tone, current))
+                lines.append(get_commentary(Tone.LONG_STREAK, self.tone, days=current))
             elif current == 0 and longest > 0:
                 lines.append(get_commentary(Tone.BROKE_STREAK, self.tone))
             else:
                 # Default commentary for active but short streaks
-                lines.append(get_commentary(Tone.ACTIVE_LISTENER, self.tone, current))
+                lines.append(get_commentary(Tone.ACTIVE_LISTENER, self.tone, days=current))
         else:
             lines.append("Streak data unavailable")
         
@@ -186,12 +199,12 @@ class Narrator:
             
             # Binge sessions?
             if longest > 50:
-                lines.append(get_commentary(Tone.BINGE_SESSION, self.tone, longest))
+                lines.append(get_commentary(Tone.BINGE_SESSION, self.tone, tracks=longest))
             elif avg_tracks < 5:
                 lines.append(get_commentary(Tone.SHORT_SESSION, self.tone))
             else:
                 # Default commentary for normal session patterns
-                lines.append(get_commentary(Tone.NORMAL_SESSION, self.tone, avg_tracks))
+                lines.append(get_commentary(Tone.NORMAL_SESSION, self.tone, tracks=avg_tracks))
             
             total_hours = sessions.get('total_listening_time_hours', 0)
             if self.tone == ToneType.ANALYST:
@@ -217,15 +230,15 @@ class Narrator:
         
         # Energy commentary
         if energy > 0.7:
-            lines.append(get_commentary(Tone.ENERGY_HIGH, self.tone, energy))
+            lines.append(get_commentary(Tone.ENERGY_HIGH, self.tone, energy=energy))
         elif energy < 0.4:
-            lines.append(get_commentary(Tone.ENERGY_LOW, self.tone, energy))
+            lines.append(get_commentary(Tone.ENERGY_LOW, self.tone, energy=energy))
         
         # Valence commentary
         if valence > 0.7:
-            lines.append(get_commentary(Tone.VALENCE_HAPPY, self.tone, valence))
+            lines.append(get_commentary(Tone.VALENCE_HAPPY, self.tone, valence=valence))
         elif valence < 0.4:
-            lines.append(get_commentary(Tone.VALENCE_SAD, self.tone, valence))
+            lines.append(get_commentary(Tone.VALENCE_SAD, self.tone, valence=valence))
         
         # Mood label
         mood_label = overall.get('mood_label', '')
@@ -239,8 +252,8 @@ class Narrator:
             recent_shift = shifts[-1]
             lines.append(get_commentary(
                 Tone.MOOD_SHIFT_DETECTED, self.tone,
-                recent_shift['before_mood'],
-                recent_shift['after_mood']
+                before=recent_shift['before_mood'],
+                after=recent_shift['after_mood']
             ))
         
         return "\n".join(lines)
@@ -9,33 +9,56 @@ Modes:
 import sys
 import os
 import io
+from typing import List
 
 # Fix encoding for emojis on Windows
 if sys.platform == "win32":
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
+# Analyzer and personality modules are imported inside the functions that
+# use them, so --help and the missing-data error path return without loading them
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from analysis.mood import MoodAnalyzer, load_tracks_from_json
-from analysis.habits import HabitsAnalyzer
-from analysis.behavior_signals import BehaviorClassifier
-from personality.roast_engine import RoastEngine
-from personality import Narrator, ToneType
 
+# Report text built once at import
+_SEP = "=" * 60
+_MENU_BANNER = "🎵" * 30
+_MENU_TEXT = (
+    "Choose your analysis style:\n"
+    "  1. 🧠 Behavioral Analysis (technical)\n"
+    "  2. 💙 Friend Mode (supportive)\n"
+    "  3. 📊 Analyst Mode (objective)\n"
+    "  4. 🔥 Roast Mode (savage)\n"
+    "  5. Show all three narratives"
+)
+_TIP_BLOCK = (
+    "\n💡 Tip: Add --roast for savage mode or --interactive for menu\n"
+    "   Examples:\n"
+    "     python scripts/analyze.py --roast\n"
+    "     python scripts/analyze.py --interactive\n"
+)
 
-def print_section(title: str, emoji: str = "📊"):
-    """Print formatted section header."""
-    print("\n" + emoji + " " + title)
-    print("=" * 60)
 
+def format_section(title: str, emoji: str = "📊") -> str:
+    """Format section header."""
+    return "\n" + emoji + " " + title + "\n" + _SEP
 
-def load_data(json_file: str = "enriched_history.json"):
+
+def load_data(json_file: str = "enriched_history.jsonl"):
     """Load and validate data."""
+    # Histories that were never migrated are still in the legacy .json file;
+    # resolved here without importing the analyzers (see analysis.mood)
+    legacy_file = os.path.splitext(json_file)[0] + ".json"
+    if not os.path.exists(json_file) and os.path.exists(legacy_file):
+        json_file = legacy_file
+    
     if not os.path.exists(json_file):
         print(f"\n❌ Error: {json_file} not found")
         print("   Run the collector first: python -m core.collector")
         return None
     
+    from analysis.mood import load_tracks_from_json
+    
     tracks = load_tracks_from_json(json_file)
     
     if len(tracks) < 5:
@@ -53,23 +76,31 @@ def behavioral_mode(tracks, savage_mode: bool = False):
         tracks: List of Track objects
         savage_mode: If True, includes roasts
     """
-    print("\n🧠 BEHAVIORAL ANALYSIS REPORT")
+    from analysis.habits import HabitsAnalyzer
+    from analysis.behavior_signals import BehaviorClassifier
+    from personality.roast_engine import RoastEngine
+    
+    # Report lines are collected and written to stdout in one go
+    out: List[str] = []
+    w = out.append
+    
+    w("\n🧠 BEHAVIORAL ANALYSIS REPORT")
     if savage_mode:
-        print("(Roast Mode: ENABLED 🔥)")
-    print("=" * 60)
-    print(f"✅ Loaded {len(tracks)} tracks\n")
+        w("(Roast Mode: ENABLED 🔥)")
+    w(_SEP)
+    w(f"✅ Loaded {len(tracks)} tracks\n")
     
     # Initialize analyzers
     habits = HabitsAnalyzer(tracks)
     behavior = BehaviorClassifier(tracks)
     
     # === BEHAVIORAL CLASSIFICATION ===
-    print_section("BEHAVIORAL STATE", "🧠")
+    w(format_section("BEHAVIORAL STATE", "🧠"))
     
     overall_state = behavior.classify_overall()
-    print(f"\nState: {overall_state.state.upper().replace('_', ' ')}")
-    print(f"Confidence: {overall_state.confidence:.0%}")
-    print(f"Intensity: {overall_state.intensity:.2f}/1.0")
+    w(f"\nState: {overall_state.state.upper().replace('_', ' ')}")
+    w(f"Confidence: {overall_state.confidence:.0%}")
+    w(f"Intensity: {overall_state.intensity:.2f}/1.0")
     
     # Display secondary behaviors if present
     if overall_state.secondary_behaviors:
@@ -77,35 +108,35 @@ def behavioral_mode(tracks, savage_mode: bool = False):
             f"{behavior} ({score:.0%})" 
             for behavior, score in overall_state.secondary_behaviors
         )
-        print(f"Secondary: {secondary_str}")
+        w(f"Secondary: {secondary_str}")
     
     if overall_state.evidence:
-        print("\nEvidence:")
+        w("\nEvidence:")
         for evidence in overall_state.evidence:
-            print(f"  • {evidence}")
+            w(f"  • {evidence}")
     
     # Intensity & deviation
     intensity = behavior.get_intensity_score()
-    print(f"\n📈 Listening Intensity: {intensity:.2f}/1.0")
+    w(f"\n📈 Listening Intensity: {intensity:.2f}/1.0")
     
     # Recent deviation
     recent_tracks = tracks[-min(20, len(tracks)):]
     deviation = behavior.get_deviation_score(recent_tracks)
     if deviation > 0.3:
-        print(f"⚠️  Deviation from baseline: {deviation:.0%} (behavior changed recently)")
+        w(f"⚠️  Deviation from baseline: {deviation:.0%} (behavior changed recently)")
     
     if savage_mode and deviation > 0.5:
         roast = RoastEngine.roast_event({
             "type": "deviation_high",
             "deviation": deviation
         })
-        print(f"\n🔥 {roast}")
+        w(f"\n🔥 {roast}")
     
     # === BEHAVIORAL EVENTS ===
     events = behavior.detect_behavioral_events()
     
     if events:
-        print_section("BEHAVIORAL EVENTS DETECTED", "🚨")
+        w(format_section("BEHAVIORAL EVENTS DETECTED", "🚨"))
         
         # Group by type
         event_summary = {}
@@ -115,41 +146,41 @@ def behavioral_mode(tracks, savage_mode: bool = False):
         
         for event_type, count in event_summary.items():
             readable_type = event_type.replace("_", " ").title()
-            print(f"\n  • {readable_type}: {count} occurrences")
+            w(f"\n  • {readable_type}: {count} occurrences")
         
         if savage_mode:
-            print_section("ROAST TIME", "🔥")
+            w(format_section("ROAST TIME", "🔥"))
             roasts = RoastEngine.roast_multiple_events(events, max_roasts=3)
             for roast in roasts:
-                print(f"\n  💀 {roast}")
+                w(f"\n  💀 {roast}")
     
     # === LISTENING PATTERNS ===
-    print_section("LISTENING PATTERNS", "📊")
+    w(format_section("LISTENING PATTERNS", "📊"))
     
     hours = habits.get_listening_hours()
     if "error" not in hours:
         peak = hours['most_active_hour']
-        print(f"\n⏰ Peak Hour: {peak}:00")
+        w(f"\n⏰ Peak Hour: {peak}:00")
         
         if savage_mode and (peak >= 22 or peak <= 3):
             roast = RoastEngine.roast_event({"type": "late_night_listener"})
-            print(f"   🔥 {roast}")
+            w(f"   🔥 {roast}")
     
     days = habits.get_day_of_week_pattern()
     if "error" not in days:
-        print(f"📅 Most Active: {days['most_active_day']}")
+        w(f"📅 Most Active: {days['most_active_day']}")
         
         if savage_mode and days.get('is_weekend_listener'):
             roast = RoastEngine.roast_event({"type": "weekend_only"})
-            print(f"   🔥 {roast}")
+            w(f"   🔥 {roast}")
     
     # === TOP ARTISTS ===
-    print_section("TOP ARTISTS", "⭐")
+    w(format_section("TOP ARTISTS", "⭐"))
     
     top_artists = habits.get_top_artists(limit=3)
     for i, artist in enumerate(top_artists, 1):
-        print(f"\n  {i}. {artist['artist']}")
-        print(f"     {artist['play_count']} plays ({artist['percentage']}%)")
+        w(f"\n  {i}. {artist['artist']}")
+        w(f"     {artist['play_count']} plays ({artist['percentage']}%)")
         
         if savage_mode and i == 1 and artist['percentage'] > 20:
             roast = RoastEngine.roast_event({
@@ -157,15 +188,15 @@ def behavioral_mode(tracks, savage_mode: bool = False):
                 "artist": artist['artist'],
                 "percentage": artist['percentage']
             })
-            print(f"     🔥 {roast}")
+            w(f"     🔥 {roast}")
     
     # === REPEAT BEHAVIOR ===
-    print_section("REPEAT BEHAVIOR", "🔁")
+    w(format_section("REPEAT BEHAVIOR", "🔁"))
     
     repeats = habits.get_repeat_behavior()
-    print(f"\n  Unique tracks: {repeats['total_unique_tracks']}")
-    print(f"  Repeated tracks: {repeats['repeated_tracks']} ({repeats['repeat_percentage']}%)")
-    print(f"  Diversity score: {repeats['diversity_score']}")
+    w(f"\n  Unique tracks: {repeats['total_unique_tracks']}")
+    w(f"  Repeated tracks: {repeats['repeated_tracks']} ({repeats['repeat_percentage']}%)")
+    w(f"  Diversity score: {repeats['diversity_score']}")
     
     if savage_mode:
         if repeats['repeat_percentage'] > 30:
@@ -173,7 +204,7 @@ def behavioral_mode(tracks, savage_mode: bool = False):
                 "type": "high_replay_rate",
                 "replay_pct": repeats['repeat_percentage']
             })
-            print(f"\n  🔥 {roast}")
+            w(f"\n  🔥 {roast}")
         
         # Most repeated song
         most_repeated = repeats.get('most_repeated', [])
@@ -184,17 +215,19 @@ def behavioral_mode(tracks, savage_mode: bool = False):
                 "song": top_repeat['song'],
                 "count": top_repeat['play_count']
             })
-            print(f"  🔥 {roast}")
+            w(f"  🔥 {roast}")
     
     # === CLOSING ===
-    print("\n" + "=" * 60)
+    w("\n" + _SEP)
     
     if savage_mode:
-        print(RoastEngine.closing_roast())
+        w(RoastEngine.closing_roast())
     else:
-        print("Analysis complete! Run with --roast for savage commentary.")
+        w("Analysis complete! Run with --roast for savage commentary.")
     
-    print("=" * 60 + "\n")
+    w(_SEP + "\n")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def interactive_mode(tracks):
@@ -204,16 +237,15 @@ def interactive_mode(tracks):
     Args:
         tracks: List of Track objects
     """
+    from analysis.mood import MoodAnalyzer
+    from analysis.habits import HabitsAnalyzer
+    from personality import Narrator, ToneType
+    
     print("\n🎵 SpotiMood Analysis - Interactive Mode")
-    print("=" * 60)
+    print(_SEP)
     print(f"✅ Loaded {len(tracks)} tracks\n")
     
-    print("Choose your analysis style:")
-    print("  1. 🧠 Behavioral Analysis (technical)")
-    print("  2. 💙 Friend Mode (supportive)")
-    print("  3. 📊 Analyst Mode (objective)")
-    print("  4. 🔥 Roast Mode (savage)")
-    print("  5. Show all three narratives")
+    print(_MENU_TEXT)
     
     choice = input("\nEnter 1-5 (or press Enter for behavioral): ").strip()
     
@@ -236,9 +268,9 @@ def interactive_mode(tracks):
         print("\n" + narrator.generate_full_report())
     
     elif choice == "5":
-        print("\n" + "🎵" * 30)
+        print("\n" + _MENU_BANNER)
         print("SHOWING ALL PERSONALITY STYLES")
-        print("🎵" * 30)
+        print(_MENU_BANNER)
         
         for tone in [ToneType.FRIEND, ToneType.ANALYST, ToneType.ROAST]:
             narrator = Narrator(mood, habits, tone=tone)
@@ -282,10 +314,7 @@ def main():
     else:
         # Default behavioral mode
         if not args.roast:
-            print("\n💡 Tip: Add --roast for savage mode or --interactive for menu")
-            print("   Examples:")
-            print("     python scripts/analyze.py --roast")
-            print("     python scripts/analyze.py --interactive\n")
+            print(_TIP_BLOCK)
         
         behavioral_mode(tracks, savage_mode=args.roast)
 
@@ -11,7 +11,7 @@ import json
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from analysis.mood import MoodAnalyzer, load_tracks_from_json
+from analysis.mood import MoodAnalyzer, load_tracks_from_json, resolve_history_path
 from analysis.habits import HabitsAnalyzer
 
 
@@ -22,7 +22,7 @@ def print_section(title: str):
     print("=" * 60)
 
 
-def analyze_history(json_file: str = "enriched_history.json"):
+def analyze_history(json_file: str = "enriched_history.jsonl"):
     """
     Run full analysis on listening history.
     
@@ -32,7 +32,8 @@ def analyze_history(json_file: str = "enriched_history.json"):
     print("\n🎵 Spotify Behavioral Analysis Report")
     print("=" * 60)
     
-    # Check if file exists
+    # Check if file exists (falling back to the legacy .json history)
+    json_file = resolve_history_path(json_file)
     if not os.path.exists(json_file):
         print(f"\n❌ Error: {json_file} not found")
         print("   Run the collector first: python -m core.collector")
@@ -4,7 +4,7 @@ Migration script to enrich existing song history with audio features.
 This script:
 1. Reads your existing song_history.csv
 2. Fetches audio features for each unique track
-3. Exports enriched data to enriched_history.json
+3. Exports enriched data to enriched_history.jsonl
 
 Usage:
     python scripts/enrich_history.py
@@ -130,16 +130,15 @@ def enrich_tracks(tracks: List[Dict], enricher: AudioFeaturesEnricher) -> List[T
 
 def export_enriched_json(tracks: List[Track], output_path: str):
     """
-    Export enriched tracks to JSON.
+    Export enriched tracks to JSON lines (one track per line).
     
     Args:
         tracks: List of Track objects
-        output_path: Path to output JSON file
+        output_path: Path to output JSON lines file
     """
-    data = [track.model_dump(mode='json') for track in tracks]
-    
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        for track in tracks:
+            f.write(json.dumps(track.model_dump(mode='json'), ensure_ascii=False, default=str) + "\n")
     
     print(f"\n✅ Exported {len(tracks)} enriched tracks to: {output_path}")
 
@@ -199,13 +198,14 @@ def main():
     # Initialize Spotify client
     print("🔑 Authenticating with Spotify...")
     sp = get_spotify_client()
-    enricher = AudioFeaturesEnricher(sp, cache_features=True)
+    enricher = AudioFeaturesEnricher(sp, cache_features=True, cache_path="features_cache.db")
     
     # Enrich tracks
     enriched_tracks = enrich_tracks(tracks, enricher)
+    enricher.close()
     
     # Export to JSON
-    output_path = "enriched_history.json"
+    output_path = "enriched_history.jsonl"
     export_enriched_json(enriched_tracks, output_path)
     
     # Print mood summary
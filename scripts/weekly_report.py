@@ -10,7 +10,7 @@ from datetime import datetime, timedelta
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from analysis.mood import MoodAnalyzer, load_tracks_from_json
+from analysis.mood import MoodAnalyzer, load_tracks_from_json, resolve_history_path
 from analysis.habits import HabitsAnalyzer
 from personality import Narrator, ToneType
 
@@ -28,7 +28,7 @@ def generate_weekly_report(tone: ToneType = ToneType.FRIEND):
     Args:
         tone: Narrator tone to use
     """
-    json_file = "enriched_history.json"
+    json_file = resolve_history_path("enriched_history.jsonl")
     
     if not os.path.exists(json_file):
         print(f"\n❌ Error: {json_file} not found")